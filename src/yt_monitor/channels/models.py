@@ -21,9 +21,13 @@ class ChannelDTO:
             raise ValueError("Channel name cannot be empty")
 
 
-@dataclass
+@dataclass(frozen=True)
 class GlobalSettingsDTO:
-    """Global settings for all channels."""
+    """Global settings for all channels.
+
+    Frozen: 변경은 ChannelManager.update_global_settings로 새 인스턴스를 만든다.
+    monitor thread들이 같은 인스턴스를 공유해도 안전하다.
+    """
 
     check_interval_seconds: int = 60
     download_directory: str = "./downloads"
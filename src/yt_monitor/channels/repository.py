@@ -5,7 +5,7 @@ import os
 import threading
 from dataclasses import asdict
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple, Union
 from uuid import uuid4
 
 from .models import ChannelDTO, GlobalSettingsDTO
@@ -14,7 +14,7 @@ from .models import ChannelDTO, GlobalSettingsDTO
 class ChannelManager:
     """Manage multiple YouTube channels for live stream monitoring."""
 
-    def __init__(self, channels_file: str = "channels.json"):
+    def __init__(self, channels_file: Union[str, os.PathLike] = "channels.json"):
         """
         Initialize ChannelManager.
 
@@ -148,6 +148,21 @@ class ChannelManager:
 
         return channels
 
+    def count_channels(self) -> Tuple[int, int]:
+        """
+        Count channels with a single file read, without building DTOs.
+
+        채널 파일은 yt-monitor 컨테이너와 공유되므로 메모리 카운터 대신
+        매번 파일 기준으로 센다.
+
+        Returns:
+            Tuple of (total_channels, enabled_channels)
+        """
+        data = self._read_data()
+        channels = data["channels"]
+        enabled_count = sum(1 for ch in channels if ch.get("enabled", True))
+        return len(channels), enabled_count
+
     def get_channel(self, channel_id: str) -> Optional[ChannelDTO]:
         """
         Get a specific channel by ID.
@@ -1,8 +1,9 @@
 """File cleanup module for managing downloaded files."""
 
+import os
 import time
 from pathlib import Path
-from typing import List, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from ..logging import Logger
 
@@ -44,57 +45,100 @@ class FileCleaner:
         except ValueError:
             return False
 
-    def _get_file_age_days(self, file_path: Path) -> float:
+    def _iter_file_stats(self) -> Iterator[Tuple[str, os.stat_result, bool]]:
         """
-        Get file age in days.
+        Lazily yield every file under the download directory.
 
-        Args:
-            file_path: Path to file
+        os.scandir의 DirEntry stat 캐시를 재사용해 파일당 stat을 한 번만 호출한다.
 
-        Returns:
-            Age of file in days
+        Yields:
+            Tuples of (file_path, stat_result, is_in_live_directory)
         """
-        modification_time = file_path.stat().st_mtime
-        current_time = time.time()
-        age_seconds = current_time - modification_time
-        return age_seconds / (24 * 60 * 60)
+        root = str(self.download_directory)
+        pending_directories: List[Tuple[str, bool]] = []
+        if self.download_directory.is_dir():
+            pending_directories.append((root, False))
 
-    def find_old_files(self) -> List[Tuple[Path, float]]:
+        while pending_directories:
+            directory, is_live = pending_directories.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                in_live = is_live or (
+                                    directory == root
+                                    and entry.name == self.live_directory_name
+                                )
+                                pending_directories.append((entry.path, in_live))
+                            elif entry.is_file():
+                                yield entry.path, entry.stat(), is_live
+                        except OSError:
+                            continue
+            except OSError:
+                continue
+
+    def scan(self) -> Tuple[Dict[str, Any], List[Tuple[Path, float]]]:
         """
-        Find files older than retention period (excluding live directory).
+        Walk the download directory once and build both the summary and old file list.
 
         Returns:
-            List of tuples containing (file_path, age_in_days)
+            Tuple of (cleanup summary, [(file_path, age_in_days)] sorted oldest first)
         """
         old_files: List[Tuple[Path, float]] = []
+        old_total_size = 0
+        live_file_count = 0
+        live_total_size = 0
+        current_time = time.time()
 
-        if not self.download_directory.exists():
-            return old_files
-
-        for file_path in self.download_directory.rglob("*"):
-            if not file_path.is_file():
-                continue
-
-            if self._is_in_live_directory(file_path):
+        for file_path, file_stat, is_live in self._iter_file_stats():
+            if is_live:
+                live_file_count += 1
+                live_total_size += file_stat.st_size
                 continue
 
-            age_days = self._get_file_age_days(file_path)
+            age_days = (current_time - file_stat.st_mtime) / (24 * 60 * 60)
             if age_days >= self.retention_days:
-                old_files.append((file_path, age_days))
+                old_files.append((Path(file_path), age_days))
+                old_total_size += file_stat.st_size
 
-        return sorted(old_files, key=lambda x: x[1], reverse=True)
+        summary = {
+            "files_to_delete": len(old_files),
+            "total_size_bytes": old_total_size,
+            "total_size_mb": old_total_size / (1024 * 1024),
+            "retention_days": self.retention_days,
+            "live_files_preserved": live_file_count,
+            "live_size_mb": live_total_size / (1024 * 1024),
+        }
+        return summary, sorted(old_files, key=lambda x: x[1], reverse=True)
+
+    def find_old_files(self) -> List[Tuple[Path, float]]:
+        """
+        Find files older than retention period (excluding live directory).
 
-    def cleanup(self, dry_run: bool = False) -> List[Path]:
+        Returns:
+            List of tuples containing (file_path, age_in_days)
+        """
+        _summary, old_files = self.scan()
+        return old_files
+
+    def cleanup(
+        self,
+        dry_run: bool = False,
+        old_files: Optional[List[Tuple[Path, float]]] = None,
+    ) -> List[Path]:
         """
         Remove files older than retention period.
 
         Args:
             dry_run: If True, only report files without deleting
+            old_files: Result of a previous scan() to reuse instead of walking again
 
         Returns:
             List of deleted (or would be deleted) file paths
         """
-        old_files = self.find_old_files()
+        if old_files is None:
+            old_files = self.find_old_files()
         deleted_files: List[Path] = []
 
         if not old_files:
@@ -133,21 +177,20 @@ class FileCleaner:
         if not self.download_directory.exists():
             return
 
-        for dir_path in sorted(
-            self.download_directory.rglob("*"),
-            key=lambda p: len(p.parts),
-            reverse=True,
+        # bottom-up 순회라 하위 디렉토리가 먼저 비워지고 삭제된다
+        for directory, _subdirectories, _filenames in os.walk(
+            self.download_directory, topdown=False
         ):
-            if not dir_path.is_dir():
+            dir_path = Path(directory)
+            if dir_path == self.download_directory:
                 continue
 
             if self._is_in_live_directory(dir_path):
                 continue
 
             try:
-                if not any(dir_path.iterdir()):
-                    dir_path.rmdir()
-                    self.logger.info(f"빈 디렉토리 삭제: {dir_path}")
+                dir_path.rmdir()
+                self.logger.info(f"빈 디렉토리 삭제: {dir_path}")
             except OSError:
                 pass
 
@@ -158,24 +201,5 @@ class FileCleaner:
         Returns:
             Dictionary containing cleanup summary
         """
-        old_files = self.find_old_files()
-        total_size = sum(f[0].stat().st_size for f in old_files)
-
-        live_dir = self.download_directory / self.live_directory_name
-        live_file_count = 0
-        live_total_size = 0
-
-        if live_dir.exists():
-            for file_path in live_dir.rglob("*"):
-                if file_path.is_file():
-                    live_file_count += 1
-                    live_total_size += file_path.stat().st_size
-
-        return {
-            "files_to_delete": len(old_files),
-            "total_size_bytes": total_size,
-            "total_size_mb": total_size / (1024 * 1024),
-            "retention_days": self.retention_days,
-            "live_files_preserved": live_file_count,
-            "live_size_mb": live_total_size / (1024 * 1024),
-        }
+        summary, _old_files = self.scan()
+        return summary
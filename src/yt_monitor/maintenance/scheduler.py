@@ -2,6 +2,7 @@
 
 import threading
 import time
+from pathlib import Path
 from typing import Callable, Optional
 
 from ..channels.repository import ChannelManager
@@ -26,6 +27,7 @@ class CleanupScheduler:
         self._logger = Logger.get()
         self._thread: Optional[threading.Thread] = None
         self._running: bool = False
+        self._cleaner: Optional[FileCleaner] = None
 
     def start(self) -> None:
         if self._thread is not None:
@@ -48,18 +50,27 @@ class CleanupScheduler:
     def run_once(self) -> None:
         """한 번의 정리 사이클을 실행한다 (테스트/수동 호출용)."""
         settings = self._channel_manager.get_global_settings()
-        cleaner = FileCleaner(
-            download_directory=settings.download_directory,
-            retention_days=self._retention_days,
-        )
+        cleaner = self._get_cleaner(settings.download_directory)
 
-        summary = cleaner.get_cleanup_summary()
+        # 요약과 삭제 대상을 한 번의 디렉토리 순회로 얻는다
+        summary, old_files = cleaner.scan()
         if summary["files_to_delete"] > 0:
             self._logger.info(
                 f"자동 정리: {summary['files_to_delete']}개 파일 "
                 f"({summary['total_size_mb']:.2f} MB) 삭제 예정"
             )
-            cleaner.cleanup(dry_run=False)
+            cleaner.cleanup(dry_run=False, old_files=old_files)
+
+    def _get_cleaner(self, download_directory: str) -> FileCleaner:
+        """download_directory 설정이 바뀐 경우에만 FileCleaner를 새로 만든다."""
+        if self._cleaner is None or self._cleaner.download_directory != Path(
+            download_directory
+        ):
+            self._cleaner = FileCleaner(
+                download_directory=download_directory,
+                retention_days=self._retention_days,
+            )
+        return self._cleaner
 
     def _loop(self) -> None:
         while self._running:
@@ -9,6 +9,11 @@
 from typing import Any, Dict, List
 
 
+# 라이브 녹화는 ffmpeg 한 프로세스가 방송 내내 돈다. 진행률(-stats) 줄이
+# stderr PIPE에 몇 시간씩 쌓이지 않도록 배너/통계 출력을 끈다.
+_LIVE_FFMPEG_PREFIX: List[str] = ["ffmpeg", "-hide_banner", "-nostats"]
+
+
 def build_ffmpeg_headers(info: Dict[str, Any]) -> List[str]:
     """yt-dlp info의 http_headers를 ffmpeg -headers 포맷으로 변환한다."""
     http_headers = info.get("http_headers", {})
@@ -28,7 +33,7 @@ def _build_dual_stream_command(
     audio = info["requested_formats"][1]
 
     return [
-        "ffmpeg",
+        *_LIVE_FFMPEG_PREFIX,
         *build_ffmpeg_headers(video),
         "-i",
         video["url"],
@@ -58,7 +63,7 @@ def _build_single_stream_command(
 ) -> List[str]:
     """단일 스트림(url 필드) 경우."""
     return [
-        "ffmpeg",
+        *_LIVE_FFMPEG_PREFIX,
         *build_ffmpeg_headers(info),
         "-i",
         info["url"],
@@ -7,20 +7,23 @@
 import os
 import subprocess
 import threading
-from datetime import datetime
+import time
+from collections import deque
 from pathlib import Path
 from typing import Optional
 
 import yt_dlp
 
 from ..logging import Logger
-from ..youtube.cookies import get_cookie_options
+from ..youtube.cookies import get_cache_options, get_cookie_options
 from .ffmpeg import build_segment_command
 from .split_strategy import NoSplit, make_split_strategy
 
 
 _FFMPEG_TERMINATE_TIMEOUT_SECONDS: float = 5.0
 _FFMPEG_KILL_TIMEOUT_SECONDS: float = 2.0
+_FFMPEG_STDERR_TAIL_LINES: int = 200
+_TIMESTAMP_FORMAT: str = "%Y%m%d_%H%M%S"
 
 
 class StreamDownloader:
@@ -45,11 +48,15 @@ class StreamDownloader:
         self._setup_directory()
 
     def _setup_directory(self):
-        Path(self.download_directory).mkdir(parents=True, exist_ok=True)
+        # 대부분 이미 있는 디렉토리 — stat 한 번으로 끝내고 없을 때만 mkdir한다
+        directory = Path(self.download_directory)
+        if not directory.is_dir():
+            directory.mkdir(parents=True, exist_ok=True)
 
     def download(self, stream_url: str, filename_prefix: str = "stream") -> bool:
         try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            # 파일명은 로컬 시각 기준 — datetime 객체 없이 time.strftime으로 바로 만든다
+            timestamp = time.strftime(_TIMESTAMP_FORMAT)
             strategy = make_split_strategy(
                 mode=self.split_mode,
                 time_minutes=self.split_time_minutes,
@@ -88,6 +95,7 @@ class StreamDownloader:
             "live_from_start": False,
             "wait_for_video": (5, 20),
             "merge_output_format": "mp4",
+            **get_cache_options(),
             **get_cookie_options(),
             "postprocessors": [
                 {
@@ -135,6 +143,7 @@ class StreamDownloader:
             "format": self.download_format,
             "quiet": True,
             "live_from_start": False,
+            **get_cache_options(),
             **get_cookie_options(),
         }
 
@@ -142,27 +151,36 @@ class StreamDownloader:
             info = ydl.extract_info(stream_url, download=False)
 
         cmd = build_segment_command(info, output_pattern, split_seconds)
+        # 세그먼트 muxer 하나가 방송 전체를 처리한다 — stdout은 쓰지 않으므로 버린다
         proc = subprocess.Popen(
             cmd,
-            stdout=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
             stderr=subprocess.PIPE,
             text=True,
+            bufsize=1,
         )
         with self._proc_lock:
             self._proc = proc
+        # 수 시간짜리 방송이면 stderr 경고도 계속 쌓인다 — communicate()로 전부 모으지 않고
+        # 한 줄씩 흘려 읽으며 에러 리포트용 마지막 몇 줄만 남긴다
+        stderr_tail: deque[str] = deque(maxlen=_FFMPEG_STDERR_TAIL_LINES)
         try:
-            _stdout, stderr = proc.communicate()
+            if proc.stderr is not None:
+                for line in proc.stderr:
+                    stderr_tail.append(line)
+            returncode = proc.wait()
         finally:
             with self._proc_lock:
                 self._proc = None
 
-        if proc.returncode != 0:
-            self.logger.error(
-                f"FFmpeg failed (exit {proc.returncode}): {(stderr or '')[-2000:]}"
-            )
-            raise Exception(
-                f"FFmpeg segmented download failed (rc={proc.returncode})"
-            )
+        if returncode != 0:
+            stderr = "".join(stderr_tail)
+            self.logger.error(f"FFmpeg failed (exit {returncode}): {stderr[-2000:]}")
+            message = f"FFmpeg segmented download failed (rc={returncode})"
+            last_line = stderr_tail[-1].strip() if stderr_tail else ""
+            if last_line:
+                message = f"{message}: {last_line}"
+            raise Exception(message)
 
     def _perform_download(self, stream_url: str, ydl_opts: dict) -> None:
         with yt_dlp.YoutubeDL(ydl_opts) as ydl:
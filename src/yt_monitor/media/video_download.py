@@ -8,12 +8,73 @@ from typing import Optional
 
 import yt_dlp
 
-from ..youtube.cookies import get_cookie_options
+from ..youtube.cookies import get_cache_options, get_cookie_options
 
 
 logger = logging.getLogger("yt_monitor.video_downloader")
 
 
+# 프래그먼트 받기는 I/O 바운드 — 코어당 2개, 최대 16개까지 병렬로 받는다
+_CONCURRENT_FRAGMENTS = min(16, (os.cpu_count() or 1) * 2)
+
+# 호출마다 바뀌지 않는 yt-dlp 옵션 템플릿 — format/outtmpl/쿠키만 호출 시점에 합친다
+_BASE_YDL_OPTIONS = {
+    "quiet": False,
+    "no_warnings": False,
+    "ignoreerrors": False,
+    # Performance optimizations
+    "concurrent_fragment_downloads": _CONCURRENT_FRAGMENTS,
+    "retries": 10,
+    "fragment_retries": 10,
+    "skip_unavailable_fragments": True,
+    "buffersize": 1024 * 1024,  # 1MB buffer
+    "http_chunk_size": 10485760,  # 10MB chunks
+}
+
+# Extract audio as MP3
+_AUDIO_YDL_OPTIONS = {
+    "postprocessors": [
+        {
+            "key": "FFmpegExtractAudio",
+            "preferredcodec": "mp3",
+            "preferredquality": "192",
+        }
+    ],
+}
+
+# Merge video+audio to MP4 - CRITICAL for audio!
+_VIDEO_YDL_OPTIONS = {
+    "merge_output_format": "mp4",
+    "prefer_ffmpeg": True,
+    "keepvideo": False,  # Delete original files after merge
+    # Use FFmpegVideoConvertor to ensure audio is AAC (Windows compatible)
+    # This will convert Opus to AAC if needed
+    "postprocessors": [
+        {
+            "key": "FFmpegVideoConvertor",
+            "preferedformat": "mp4",
+        },
+        {
+            "key": "FFmpegMetadata",
+            "add_metadata": True,
+        },
+    ],
+    # Force audio conversion to AAC for Windows Media Player compatibility
+    "postprocessor_args": {
+        "FFmpegVideoConvertor": [
+            "-c:v",
+            "copy",  # Copy video (no re-encoding)
+            "-c:a",
+            "aac",  # Convert audio to AAC
+            "-b:a",
+            "192k",  # Audio bitrate
+            "-ar",
+            "48000",  # Sample rate
+        ]
+    },
+}
+
+
 class VideoDownloader:
     """Download regular YouTube videos (non-live)."""
 
@@ -38,7 +99,10 @@ class VideoDownloader:
 
     def _setup_directory(self):
         """Create output directory if it doesn't exist."""
-        Path(self.output_dir).mkdir(parents=True, exist_ok=True)
+        # 디렉토리는 정리 작업/사용자가 지울 수 있어 프로세스 단위로 캐시하지 않는다
+        output_dir = Path(self.output_dir)
+        if not output_dir.is_dir():
+            output_dir.mkdir(parents=True, exist_ok=True)
 
     def _get_format_string(self) -> str:
         """
@@ -68,66 +132,20 @@ class VideoDownloader:
         Returns:
             Dictionary of yt-dlp options
         """
-        opts = {
+        # yt-dlp는 params dict를 그대로 잡고 최상위 키를 고쳐 쓰므로 매 호출 새 dict로 합친다.
+        # 중첩 값 중 호출자가 고칠 수 있는 건 postprocessors 리스트뿐이라 그것만 복사한다
+        # (postprocessor_args는 yt-dlp가 읽기만 한다)
+        mode_opts = _AUDIO_YDL_OPTIONS if self.audio_only else _VIDEO_YDL_OPTIONS
+        return {
             "format": self._get_format_string(),
             "outtmpl": output_path,
-            "quiet": False,
-            "no_warnings": False,
-            "ignoreerrors": False,
+            **_BASE_YDL_OPTIONS,
+            **get_cache_options(),
             **get_cookie_options(),
-            # Performance optimizations
-            "concurrent_fragment_downloads": 8,  # Download 8 fragments in parallel
-            "retries": 10,
-            "fragment_retries": 10,
-            "skip_unavailable_fragments": True,
-            "buffersize": 1024 * 1024,  # 1MB buffer
-            "http_chunk_size": 10485760,  # 10MB chunks
+            **mode_opts,
+            "postprocessors": [dict(pp) for pp in mode_opts["postprocessors"]],
         }
 
-        if self.audio_only:
-            # Extract audio as MP3
-            opts["postprocessors"] = [
-                {
-                    "key": "FFmpegExtractAudio",
-                    "preferredcodec": "mp3",
-                    "preferredquality": "192",
-                }
-            ]
-        else:
-            # Merge video+audio to MP4 - CRITICAL for audio!
-            opts["merge_output_format"] = "mp4"
-            opts["prefer_ffmpeg"] = True
-            opts["keepvideo"] = False  # Delete original files after merge
-
-            # Use FFmpegVideoConvertor to ensure audio is AAC (Windows compatible)
-            # This will convert Opus to AAC if needed
-            opts["postprocessors"] = [
-                {
-                    "key": "FFmpegVideoConvertor",
-                    "preferedformat": "mp4",
-                },
-                {
-                    "key": "FFmpegMetadata",
-                    "add_metadata": True,
-                },
-            ]
-
-            # Force audio conversion to AAC for Windows Media Player compatibility
-            opts["postprocessor_args"] = {
-                "FFmpegVideoConvertor": [
-                    "-c:v",
-                    "copy",  # Copy video (no re-encoding)
-                    "-c:a",
-                    "aac",  # Convert audio to AAC
-                    "-b:a",
-                    "192k",  # Audio bitrate
-                    "-ar",
-                    "48000",  # Sample rate
-                ]
-            }
-
-        return opts
-
     def download(self, url: str, filename: Optional[str] = None) -> bool:
         """
         Download a YouTube video.
@@ -161,29 +179,31 @@ class VideoDownloader:
                 f"다운로드 시작: url={url} mode={mode} output={output_path}"
             )
 
+            # extract_info(download=True) 한 번으로 메타데이터 조회와 다운로드를
+            # 함께 처리한다 — download([url])을 따로 부르면 페이지를 다시 가져온다.
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=False)
-                title = info.get("title", "Unknown")
-                duration = info.get("duration", 0)
-                logger.info(
-                    f"제목={title} 길이={duration // 60}분 {duration % 60}초"
-                )
+                info = ydl.extract_info(url, download=True) or {}
 
-                ydl.download([url])
-
-            logger.info(f"저장 완료: {output_path}")
+            title = info.get("title", "Unknown")
+            duration = info.get("duration") or 0
+            logger.info(
+                f"저장 완료: {output_path} "
+                f"제목={title} 길이={duration // 60}분 {duration % 60}초"
+            )
             return True
 
         except Exception as e:
             logger.error(f"다운로드 실패: {e}")
             return False
 
-    def get_video_info(self, url: str) -> dict:
+    def get_video_info(self, url: str, fast: bool = False) -> dict:
         """
         Get video information without downloading.
 
         Args:
             url: YouTube video URL
+            fast: True면 player JS/DASH/HLS 조회를 건너뛴다 — 제목/길이/업로더 등
+                메타데이터만 필요할 때 사용하며, formats는 비어 있을 수 있다
 
         Returns:
             Dictionary containing video information
@@ -196,8 +216,27 @@ class VideoDownloader:
             "no_check_certificates": True,
             "socket_timeout": 30,
             "format": "best",  # Use fallback format to avoid "format not available" errors
+            **get_cache_options(),
             **get_cookie_options(),
         }
+        if fast:
+            ydl_opts.update(
+                {
+                    "extract_flat": "in_playlist",
+                    "youtube_include_dash_manifest": False,
+                    "youtube_include_hls_manifest": False,
+                    # 서명 해독용 base.js를 받지 않으면 format이 없을 수 있다
+                    "ignore_no_formats_error": True,
+                    # get_cookie_options()의 PO 토큰 provider 설정은 유지한다
+                    "extractor_args": {
+                        **ydl_opts.get("extractor_args", {}),
+                        "youtube": {
+                            "player_skip": ["js", "configs"],
+                            "skip": ["hls", "dash"],
+                        },
+                    },
+                }
+            )
 
         with yt_dlp.YoutubeDL(ydl_opts) as ydl:
             info = ydl.extract_info(url, download=False)
@@ -210,6 +249,7 @@ class VideoDownloader:
             "upload_date": info.get("upload_date"),
             "description": info.get("description"),
             "thumbnail": info.get("thumbnail"),
+            "is_live": info.get("is_live"),
             "formats": [
                 {
                     "format_id": f.get("format_id"),
@@ -41,7 +41,7 @@ class MultiChannelMonitor:
         """Publish daemon status for yt-web through the shared logs volume."""
         try:
             settings = self.channel_manager.get_global_settings()
-            total_channels = len(self.channel_manager.list_channels())
+            total_channels, _enabled_channels = self.channel_manager.count_channels()
             with self._monitor_threads_lock:
                 active_channels = len(self.monitor_threads)
             write_monitor_status(
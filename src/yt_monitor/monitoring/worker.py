@@ -1,7 +1,6 @@
 """Per-channel live detection and recording worker."""
 
 import threading
-import time
 from pathlib import Path
 from typing import Optional
 
@@ -51,18 +50,20 @@ class ChannelMonitorThread:
         self.is_running = False
         self.is_downloading = False
         self.thread: Optional[threading.Thread] = None
+        # check 간격 대기를 stop()이 즉시 깨울 수 있도록 sleep 대신 Event로 기다린다
+        self._stop_event: threading.Event = threading.Event()
         self._notifier: DiscordNotifier = notifier or get_notifier()
         self._auth_alert_cooldown: AlertCooldown = (
             auth_alert_cooldown
             or AlertCooldown(cooldown_seconds=_AUTH_ALERT_COOLDOWN_SECONDS)
         )
 
+        # 디렉토리 생성은 StreamDownloader._setup_directory가 맡는다
         channel_download_dir = (
             Path(global_settings.download_directory)
             / "live"
             / _sanitize_name(channel.name)
         )
-        channel_download_dir.mkdir(parents=True, exist_ok=True)
 
         self.downloader = StreamDownloader(
             download_directory=str(channel_download_dir),
@@ -78,6 +79,7 @@ class ChannelMonitorThread:
             return
 
         self.is_running = True
+        self._stop_event.clear()
         self.thread = threading.Thread(target=self._monitor_loop, daemon=True)
         self.thread.start()
         self.logger.info(f"Started monitoring channel: {self.channel.name}")
@@ -87,8 +89,10 @@ class ChannelMonitorThread:
 
         진행 중인 ffmpeg 다운로드도 함께 끊어 좀비를 막는다.
         downloader.stop()은 진행 중이 아니면 no-op.
+        check 간격 대기는 _stop_event로 깨우므로 join이 간격만큼 기다리지 않는다.
         """
         self.is_running = False
+        self._stop_event.set()
         self.downloader.stop()
         if self.thread:
             self.thread.join(timeout=5.0)
@@ -111,7 +115,7 @@ class ChannelMonitorThread:
                     error_message=str(error),
                 )
 
-            time.sleep(self.global_settings.check_interval_seconds)
+            self._stop_event.wait(self.global_settings.check_interval_seconds)
 
     def _maybe_notify_auth_error(self, error_message: str) -> None:
         """쿨다운을 통과한 경우에만 봇 감지 알림을 전송한다."""
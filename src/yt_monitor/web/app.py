@@ -1,9 +1,16 @@
 """WebAPI 조립자 — FastAPI 앱 + 미들웨어 + 라우트 등록 + cleanup 스케줄러."""
 
+import asyncio
+import importlib
+import os
 import time
 import tomllib
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import AsyncIterator
 
+import anyio.to_thread
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -12,6 +19,7 @@ from ..logging import Logger
 from ..maintenance.scheduler import CleanupScheduler
 from ..media.merge import MergeJobManager
 from ..media.split import SplitJobManager
+from .middleware import ApiGZipMiddleware
 from .routes import (
     register_channel_routes,
     register_cookie_routes,
@@ -27,6 +35,22 @@ _PYPROJECT_PATH = Path(__file__).resolve().parents[3] / "pyproject.toml"
 _APP_VERSION = tomllib.loads(_PYPROJECT_PATH.read_text(encoding="utf-8"))["project"][
     "version"
 ]
+_DEFAULT_THREAD_POOL_SIZE = 64
+
+
+def _read_thread_pool_size() -> int:
+    raw_size = os.environ.get("YT_WEB_THREAD_POOL_SIZE") or str(
+        _DEFAULT_THREAD_POOL_SIZE
+    )
+    try:
+        return max(1, int(raw_size))
+    except ValueError:
+        return _DEFAULT_THREAD_POOL_SIZE
+
+
+def _preload_youtube_extractor() -> None:
+    """yt-dlp lazy extractor가 첫 요청 때 불러오는 YouTube 추출기 모듈을 미리 import한다."""
+    importlib.import_module("yt_dlp.extractor.youtube")
 
 
 class WebAPI:
@@ -37,7 +61,12 @@ class WebAPI:
         Args:
             channels_file: 채널 설정 파일 경로
         """
-        self.app = FastAPI(title="YouTube Live Monitor", version=_APP_VERSION)
+        self.thread_pool_size = _read_thread_pool_size()
+        self.app = FastAPI(
+            title="YouTube Live Monitor",
+            version=_APP_VERSION,
+            lifespan=self._lifespan,
+        )
         self.app.add_middleware(
             CORSMiddleware,
             allow_origins=["*"],
@@ -45,6 +74,7 @@ class WebAPI:
             allow_methods=["*"],
             allow_headers=["*"],
         )
+        self.app.add_middleware(ApiGZipMiddleware, minimum_size=1024, compresslevel=1)
 
         self.channel_manager = ChannelManager(channels_file=channels_file)
         self.boot_time = time.time()
@@ -65,6 +95,38 @@ class WebAPI:
         self.cleanup_scheduler = CleanupScheduler(channel_manager=self.channel_manager)
         self.cleanup_scheduler.start()
 
+    @asynccontextmanager
+    async def _lifespan(self, _app: FastAPI) -> AsyncIterator[None]:
+        """yt-dlp/ffmpeg 블로킹 호출 전용 thread pool을 기본 executor로 건다.
+
+        asyncio.to_thread(기본 executor)와 sync 엔드포인트(anyio limiter)가
+        작은 기본 풀을 공유하면 긴 다운로드가 다른 요청을 줄 세운다.
+        """
+        executor = ThreadPoolExecutor(
+            max_workers=self.thread_pool_size,
+            thread_name_prefix="ytw",
+        )
+        asyncio.get_running_loop().set_default_executor(executor)
+        anyio.to_thread.current_default_thread_limiter().total_tokens = (
+            self.thread_pool_size
+        )
+        # 첫 /video 요청이 추출기 import 비용을 치르지 않도록 풀에서 미리 데운다
+        executor.submit(_preload_youtube_extractor).add_done_callback(
+            self._log_preload_failure
+        )
+        try:
+            yield
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _log_preload_failure(self, future: Future) -> None:
+        """추출기 미리 불러오기가 실패하면 경고만 남긴다 — 첫 요청이 다시 시도한다."""
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            self.logger.warning(f"yt-dlp YouTube extractor preload failed: {error}")
+
     def _register_routes(self) -> None:
         register_meta_routes(self.app)
         register_channel_routes(self.app, self.channel_manager)
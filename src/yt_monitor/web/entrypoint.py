@@ -16,17 +16,24 @@ def main() -> None:
     host = "0.0.0.0"
     channels_file = "channels.json"
 
-    print("=" * 60)
-    print("YouTube Live Monitor - Web Interface")
-    print("=" * 60)
-    print(f"Server starting at http://{host}:{port}")
-    print(f"Channels file: {channels_file}")
-    print()
-    print("Open your browser and navigate to:")
-    print(f"  http://localhost:{port}")
-    print()
-    print("Press Ctrl+C to stop the server")
-    print("=" * 60)
+    # 배너는 한 번의 write로 내보낸다 — 줄마다 print하면 줄 수만큼 flush된다
+    print(
+        "\n".join(
+            [
+                "=" * 60,
+                "YouTube Live Monitor - Web Interface",
+                "=" * 60,
+                f"Server starting at http://{host}:{port}",
+                f"Channels file: {channels_file}",
+                "",
+                "Open your browser and navigate to:",
+                f"  http://localhost:{port}",
+                "",
+                "Press Ctrl+C to stop the server",
+                "=" * 60,
+            ]
+        )
+    )
 
     web_api = WebAPI(channels_file=channels_file)
     web_api.run(host=host, port=port)
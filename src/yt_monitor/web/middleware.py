@@ -0,0 +1,50 @@
+"""응답 압축 미들웨어 — JSON/HTML은 gzip, 영상 파일 다운로드는 그대로 흘려보낸다."""
+
+from fastapi.middleware.gzip import GZipMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+# 파일을 그대로 내려주는 라우트만 압축에서 뺀다
+_FILE_DOWNLOAD_PREFIX = "/api/download/file/"
+# /api/{merge,split}/jobs/{job_id}/download[/...]
+_JOB_DOWNLOAD_PREFIXES = ("/api/merge/jobs/", "/api/split/jobs/")
+_JOB_DOWNLOAD_SEGMENT_INDEX = 5
+
+
+def _is_file_download(path: str) -> bool:
+    if path.startswith(_FILE_DOWNLOAD_PREFIX):
+        return True
+    if not path.startswith(_JOB_DOWNLOAD_PREFIXES):
+        return False
+    segments = path.split("/")
+    return (
+        len(segments) > _JOB_DOWNLOAD_SEGMENT_INDEX
+        and segments[_JOB_DOWNLOAD_SEGMENT_INDEX] == "download"
+    )
+
+
+class ApiGZipMiddleware:
+    """GZipMiddleware를 API 응답에만 적용한다.
+
+    수 GB 영상 FileResponse까지 압축하면 CPU만 쓰고 크기는 거의 줄지 않으며
+    Content-Length도 사라진다. 파일 다운로드 라우트(`/api/download/file/...`,
+    `/api/{merge,split}/jobs/{id}/download...`)만 압축을 건너뛴다.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        compresslevel: int = 1,
+    ):
+        self._app = app
+        self._gzip_app = GZipMiddleware(
+            app,
+            minimum_size=minimum_size,
+            compresslevel=compresslevel,
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and _is_file_download(scope["path"]):
+            await self._app(scope, receive, send)
+            return
+        await self._gzip_app(scope, receive, send)
@@ -1,8 +1,7 @@
 """/api/channels 엔드포인트."""
 
-from typing import Any, Dict, List
-
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import JSONResponse
 
 from ...channels.repository import ChannelManager
 from ...youtube.url import sanitize_youtube_url
@@ -14,12 +13,14 @@ def register_channel_routes(
     app: FastAPI,
     channel_manager: ChannelManager,
 ) -> None:
-    @app.get("/api/channels", response_model=List[Dict[str, Any]])
+    # 응답은 channel_to_dict가 이미 JSON-safe dict를 만든다 — response_model
+    # 검증/jsonable_encoder 재귀를 건너뛰도록 JSONResponse를 직접 반환한다.
+    @app.get("/api/channels")
     async def list_channels(enabled_only: bool = False):
         channels = channel_manager.list_channels(enabled_only=enabled_only)
-        return [channel_to_dict(ch) for ch in channels]
+        return JSONResponse([channel_to_dict(ch) for ch in channels])
 
-    @app.post("/api/channels", response_model=Dict[str, Any])
+    @app.post("/api/channels")
     async def create_channel(channel: ChannelCreateRequest):
         try:
             clean_url = sanitize_youtube_url(channel.url)
@@ -30,12 +31,12 @@ def register_channel_routes(
                 download_format=channel.download_format,
             )
 
-            return channel_to_dict(new_channel)
+            return JSONResponse(channel_to_dict(new_channel))
 
         except ValueError as error:
             raise HTTPException(status_code=400, detail=str(error))
 
-    @app.patch("/api/channels/{channel_id}", response_model=Dict[str, Any])
+    @app.patch("/api/channels/{channel_id}")
     async def update_channel(channel_id: str, channel: ChannelUpdateRequest):
         try:
             clean_url = sanitize_youtube_url(channel.url) if channel.url else None
@@ -52,7 +53,7 @@ def register_channel_routes(
         if not updated_channel:
             raise HTTPException(status_code=404, detail="Channel not found")
 
-        return channel_to_dict(updated_channel)
+        return JSONResponse(channel_to_dict(updated_channel))
 
     @app.delete("/api/channels/{channel_id}")
     async def delete_channel(channel_id: str):
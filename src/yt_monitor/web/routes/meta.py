@@ -11,6 +11,12 @@ def register_meta_routes(app: FastAPI) -> None:
     web_dir = Path(__file__).resolve().parents[4] / "web"
     if web_dir.exists():
         app.mount("/static", StaticFiles(directory=web_dir), name="static")
+    html_file = web_dir / "index.html"
+    # index.html은 mtime이 바뀔 때만 다시 읽는다 (개발 중 수정은 재시작 없이 반영).
+    index_cache = {
+        "mtime_ns": -1,
+        "content": b"",
+    }
 
     @app.get("/health")
     async def health_check():
@@ -20,7 +26,16 @@ def register_meta_routes(app: FastAPI) -> None:
     @app.get("/")
     async def root():
         """웹 인터페이스 HTML 서빙."""
-        html_file = web_dir / "index.html"
-        if html_file.exists():
-            return HTMLResponse(content=html_file.read_text(encoding="utf-8"))
-        return {"message": "YouTube Live Monitor API"}
+        try:
+            mtime_ns = html_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            return {"message": "YouTube Live Monitor API"}
+
+        if index_cache["mtime_ns"] != mtime_ns:
+            index_cache.update(
+                {
+                    "mtime_ns": mtime_ns,
+                    "content": html_file.read_bytes(),
+                }
+            )
+        return HTMLResponse(content=index_cache["content"])
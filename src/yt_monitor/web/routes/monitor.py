@@ -18,8 +18,7 @@ def register_monitor_routes(
 ) -> None:
     @app.get("/api/monitor/status", response_model=MonitorStatus)
     async def get_monitor_status():
-        total_channels = len(channel_manager.list_channels())
-        active_channels = len(channel_manager.list_channels(enabled_only=True))
+        total_channels, active_channels = channel_manager.count_channels()
         settings = channel_manager.get_global_settings()
         daemon_status = read_monitor_status(settings.log_file)
 
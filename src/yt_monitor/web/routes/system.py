@@ -82,10 +82,9 @@ def register_system_routes(
             )
 
         notifier = get_notifier()
-        configured_active_channels = len(
-            channel_manager.list_channels(enabled_only=True)
+        configured_total_channels, configured_active_channels = (
+            channel_manager.count_channels()
         )
-        configured_total_channels = len(channel_manager.list_channels())
         monitor = read_monitor_status(settings.log_file)
         monitor.update(
             {
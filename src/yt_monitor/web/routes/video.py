@@ -1,8 +1,10 @@
 """/api/video/*, /api/download, /api/download/file 엔드포인트."""
 
 import asyncio
+import time
 from datetime import datetime
 from pathlib import Path
+from typing import Any, Dict, Tuple
 
 from fastapi import FastAPI, HTTPException
 from fastapi.responses import FileResponse
@@ -13,24 +15,65 @@ from ...media.video_download import VideoDownloader
 from ...youtube.url import sanitize_youtube_url
 from ..schemas import VideoDownloadRequest
 
+VIDEO_INFO_CACHE_TTL_SECONDS = 60.0
+VIDEO_INFO_CACHE_MAX_ENTRIES = 512
+
+
+def _store_video_info(
+    cache: Dict[str, Tuple[float, Dict[str, Any]]],
+    key: str,
+    info: Dict[str, Any],
+    now: float,
+) -> None:
+    """key를 맨 뒤에 (다시) 넣는다 — 새 키일 때만 만료/오래된 항목을 밀어낸다.
+
+    TTL이 고정이고 갱신 시 맨 뒤에 다시 넣으므로 삽입 순서가 곧 만료 순서다.
+    """
+    # 조회가 await하는 사이 같은 URL 요청이 먼저 넣었을 수 있다 — 갱신이면 자리만 옮긴다
+    if cache.pop(key, None) is None:
+        while cache:
+            oldest_key = next(iter(cache))
+            if cache[oldest_key][0] > now:
+                break
+            del cache[oldest_key]
+        if len(cache) >= VIDEO_INFO_CACHE_MAX_ENTRIES:
+            cache.pop(next(iter(cache)))
+    cache[key] = (now + VIDEO_INFO_CACHE_TTL_SECONDS, info)
+
 
 def register_video_routes(
     app: FastAPI,
     channel_manager: ChannelManager,
 ) -> None:
     logger = Logger.get()
+    # clean_url -> (expires_at, info). UI 재렌더/재시도로 같은 URL 조회가 반복된다.
+    video_info_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
 
     @app.post("/api/video/info")
     async def get_video_info(request: VideoDownloadRequest):
         try:
             clean_url = sanitize_youtube_url(request.url)
-            logger.info(f"Fetching video info for: {clean_url}")
-            downloader = VideoDownloader()
-
-            info = await asyncio.wait_for(
-                asyncio.to_thread(downloader.get_video_info, clean_url),
-                timeout=20.0,
-            )
+            now = time.monotonic()
+            cached = video_info_cache.get(clean_url)
+            if cached is not None and cached[0] > now:
+                info = cached[1]
+            else:
+                # 만료된 항목은 지우고, 갱신 시 맨 뒤에 다시 넣어 FIFO 순서를 맞춘다
+                video_info_cache.pop(clean_url, None)
+                logger.info(f"Fetching video info for: {clean_url}")
+                downloader = VideoDownloader()
+
+                info = await asyncio.wait_for(
+                    # 응답에 formats를 쓰지 않으므로 player JS 조회를 건너뛴다
+                    asyncio.to_thread(
+                        downloader.get_video_info, clean_url, fast=True
+                    ),
+                    timeout=20.0,
+                )
+
+                # 라이브는 제목/조회수가 계속 바뀌므로 캐시하지 않는다
+                if not info.get("is_live"):
+                    _store_video_info(video_info_cache, clean_url, info, now)
 
             logger.info(f"Video info retrieved: {info.get('title', 'Unknown')}")
 
@@ -12,10 +12,8 @@ URL/옵션/파싱 방식만 다르므로 DetectionStrategy로 캡슐화한다.
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple
 
-import yt_dlp
-
 from ..logging import Logger
-from .cookies import get_cookie_options
+from .cookies import get_cache_options, get_cookie_options
 
 
 _AUTH_ERROR_PATTERNS: Tuple[str, ...] = (
@@ -135,12 +133,16 @@ class YouTubeClient:
         channel_url: str,
         strategy: DetectionStrategy,
     ) -> Optional[LiveStreamInfo]:
+        # yt_dlp import는 추출기 레지스트리까지 끌어와 무겁다 — 실제 탐지 때만 불러온다
+        import yt_dlp
+
         target_url = channel_url.rstrip("/") + strategy.url_suffix
 
         ydl_opts = {
             "quiet": True,
             "no_warnings": True,
             **strategy.extra_opts,
+            **get_cache_options(),
             **get_cookie_options(),
         }
 
@@ -9,7 +9,7 @@ import time
 from dataclasses import asdict, dataclass
 from typing import Any, Callable, Dict, Optional
 
-from .cookies import _TEST_VIDEO_URL, get_cookie_options
+from .cookies import _TEST_VIDEO_URL, get_cache_options, get_cookie_options
 
 
 _DEFAULT_CACHE_TTL_SECONDS: float = 300.0
@@ -82,6 +82,7 @@ class CookieValidator:
                 "skip_download": True,
                 "extract_flat": True,
                 "socket_timeout": 15,
+                **get_cache_options(),
                 **get_cookie_options(),
             }
 
@@ -8,6 +8,9 @@ _REMOTE_COMPONENTS: List[str] = ["ejs:github"]
 _TEST_VIDEO_URL: str = "https://www.youtube.com/watch?v=jNQXAC9IVRw"
 _POT_PROVIDER_URL: str = os.environ.get("YT_POT_PROVIDER_URL", "")
 _DOCKER_FIREFOX_PROFILE: str = "/app/firefox_profile"
+# player JS 서명 해독 결과 등 yt-dlp 캐시 위치. 컨테이너 재생성 후에도 남도록
+# compose에서 볼륨 경로를 지정한다 (미설정 시 yt-dlp 기본 ~/.cache/yt-dlp).
+_YT_DLP_CACHE_DIR: str = os.environ.get("YT_DLP_CACHE_DIR", "")
 
 
 def _is_docker() -> bool:
@@ -30,6 +33,13 @@ def _get_firefox_profile_path() -> str:
     return ""
 
 
+def get_cache_options() -> Dict[str, Any]:
+    """yt-dlp 캐시 디렉터리 옵션을 반환한다. 미설정 시 빈 dict (yt-dlp 기본 위치 사용)."""
+    if _YT_DLP_CACHE_DIR:
+        return {"cachedir": _YT_DLP_CACHE_DIR}
+    return {}
+
+
 def get_cookie_options() -> Dict[str, Any]:
     """환경에 따라 yt-dlp에 전달할 cookie/인증 옵션을 반환한다.
 
@@ -1,33 +1,56 @@
 """Channel and global-settings model contracts."""
 
+from dataclasses import FrozenInstanceError
+from functools import cache
+
 import pytest
 
 from src.yt_monitor.channels.models import ChannelDTO, GlobalSettingsDTO
 
+_VALID_CHANNEL_KWARGS = {
+    "id": "test-id",
+    "name": "Test Channel",
+    "url": "https://www.youtube.com/@TestChannel",
+}
+
+
+@cache
+def _default_global_settings() -> GlobalSettingsDTO:
+    """GlobalSettingsDTO는 frozen이므로 기본값 인스턴스를 테스트 간에 공유한다."""
+    return GlobalSettingsDTO()
+
 
 class TestChannelDTO:
     """Test cases for ChannelDTO dataclass."""
 
     def test_channel_dto_defaults(self):
         """사용자가 생략한 운영 필드는 안전한 기본값을 사용한다."""
-        channel = ChannelDTO(
-            id="test-id",
-            name="Test Channel",
-            url="https://www.youtube.com/@TestChannel",
-        )
+        channel = ChannelDTO(**_VALID_CHANNEL_KWARGS)
 
         assert channel.enabled is True
         assert "bestvideo" in channel.download_format
 
-    def test_channel_dto_validation_empty_url(self):
-        """Test that empty URL raises ValueError."""
-        with pytest.raises(ValueError, match="Channel URL cannot be empty"):
-            ChannelDTO(id="test-id", name="Test Channel", url="")
+    @pytest.mark.parametrize(
+        ("overrides", "match"),
+        [
+            ({"enabled": False}, None),
+            ({"download_format": "bestvideo[height<=1080]+bestaudio"}, None),
+            ({"url": ""}, "Channel URL cannot be empty"),
+            ({"name": ""}, "Channel name cannot be empty"),
+        ],
+        ids=["disabled", "custom_format", "empty_url", "empty_name"],
+    )
+    def test_channel_dto_spec(self, overrides: dict, match: str | None):
+        """유효한 조합은 그대로 보존되고, 빈 필수 필드는 ValueError."""
+        kwargs = {**_VALID_CHANNEL_KWARGS, **overrides}
+        if match is not None:
+            with pytest.raises(ValueError, match=match):
+                ChannelDTO(**kwargs)
+            return
 
-    def test_channel_dto_validation_empty_name(self):
-        """Test that empty name raises ValueError."""
-        with pytest.raises(ValueError, match="Channel name cannot be empty"):
-            ChannelDTO(id="test-id", name="", url="https://www.youtube.com/@Test")
+        channel = ChannelDTO(**kwargs)
+        for field, value in kwargs.items():
+            assert getattr(channel, field) == value
 
 
 class TestGlobalSettingsDTO:
@@ -35,7 +58,7 @@ class TestGlobalSettingsDTO:
 
     def test_global_settings_defaults(self):
         """Test GlobalSettingsDTO default values."""
-        settings = GlobalSettingsDTO()
+        settings = _default_global_settings()
 
         assert settings.check_interval_seconds == 60
         assert settings.download_directory == "./downloads"
@@ -44,20 +67,25 @@ class TestGlobalSettingsDTO:
         assert settings.split_time_minutes == 30
         assert settings.split_size_mb == 500
 
-    def test_global_settings_validation_invalid_check_interval(self):
-        """Test that check_interval_seconds < 1 raises ValueError."""
-        with pytest.raises(
-            ValueError, match="check_interval_seconds must be at least 1"
-        ):
-            GlobalSettingsDTO(check_interval_seconds=0)
+    def test_global_settings_is_immutable(self):
+        """공유되는 설정 인스턴스는 제자리 수정이 불가능하다."""
+        with pytest.raises(FrozenInstanceError):
+            _default_global_settings().split_mode = "size"  # type: ignore[misc]
 
-    def test_global_settings_validation_invalid_split_mode(self):
-        """Test that invalid split_mode raises ValueError."""
-        with pytest.raises(ValueError, match="split_mode must be"):
-            GlobalSettingsDTO(split_mode="invalid")
+    @pytest.mark.parametrize(
+        ("kwargs", "match"),
+        [
+            ({"check_interval_seconds": 0}, "check_interval_seconds must be at least 1"),
+            ({"split_mode": "invalid"}, "split_mode must be"),
+        ],
+        ids=["invalid_check_interval", "invalid_split_mode"],
+    )
+    def test_global_settings_validation_errors(self, kwargs: dict, match: str):
+        """Test that invalid settings raise ValueError."""
+        with pytest.raises(ValueError, match=match):
+            GlobalSettingsDTO(**kwargs)
 
-    def test_global_settings_valid_split_modes(self):
+    @pytest.mark.parametrize("mode", ["time", "size", "none"])
+    def test_global_settings_valid_split_modes(self, mode: str):
         """Test all valid split_mode values."""
-        for mode in ["time", "size", "none"]:
-            settings = GlobalSettingsDTO(split_mode=mode)
-            assert settings.split_mode == mode
+        assert GlobalSettingsDTO(split_mode=mode).split_mode == mode
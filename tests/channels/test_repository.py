@@ -4,8 +4,77 @@ from pathlib import Path
 
 import pytest
 
+from src.yt_monitor.channels.models import ChannelDTO
 from src.yt_monitor.channels.repository import ChannelManager
 
+TEST_CHANNEL_URL = "https://www.youtube.com/@TestChannel"
+TEST_CHANNEL_NAME = "Test Channel"
+CUSTOM_DOWNLOAD_FORMAT = "bestvideo[height<=1080]+bestaudio"
+
+
+def _add_test_channel(manager: ChannelManager, **overrides) -> ChannelDTO:
+    return manager.add_channel(
+        name=TEST_CHANNEL_NAME, url=TEST_CHANNEL_URL, **overrides
+    )
+
+
+@pytest.fixture(scope="class")
+def shared_manager(tmp_path_factory: pytest.TempPathFactory) -> ChannelManager:
+    """조회 전용 테스트가 공유하는 매니저 — 클래스당 한 번만 파일을 만든다."""
+    channels_file = tmp_path_factory.mktemp("read_only") / "channels.json"
+    manager = ChannelManager(channels_file=channels_file)
+    manager.add_channel(
+        name="Enabled", url="https://www.youtube.com/@Enabled", enabled=True
+    )
+    manager.add_channel(
+        name="Disabled", url="https://www.youtube.com/@Disabled", enabled=False
+    )
+    return manager
+
+
+@pytest.fixture(scope="class")
+def enabled_channel(shared_manager: ChannelManager) -> ChannelDTO:
+    return shared_manager.list_channels(enabled_only=True)[0]
+
+
+class TestChannelManagerReadOnly:
+    """Read-only ChannelManager contracts (never mutate shared_manager)."""
+
+    def test_list_channels_enabled_only(self, shared_manager: ChannelManager):
+        """Test listing only enabled channels."""
+        channels = shared_manager.list_channels(enabled_only=True)
+
+        assert len(channels) == 1
+        assert channels[0].name == "Enabled"
+
+    def test_count_channels_returns_total_and_enabled(
+        self, shared_manager: ChannelManager
+    ):
+        """Test counting channels without building DTOs."""
+        assert shared_manager.count_channels() == (2, 1)
+
+    def test_get_channel(
+        self, shared_manager: ChannelManager, enabled_channel: ChannelDTO
+    ):
+        """Test getting a specific channel by ID."""
+        channel = shared_manager.get_channel(enabled_channel.id)
+
+        assert channel is not None
+        assert channel.id == enabled_channel.id
+        assert channel.name == "Enabled"
+
+    def test_get_channel_not_found(self, shared_manager: ChannelManager):
+        """Test getting a non-existent channel."""
+        assert shared_manager.get_channel("nonexistent-id") is None
+
+    def test_get_global_settings(self, shared_manager: ChannelManager):
+        """Test getting global settings."""
+        settings = shared_manager.get_global_settings()
+
+        assert settings.check_interval_seconds == 60
+        assert settings.split_mode == "time"
+
+
 class TestChannelManager:
     """Test cases for ChannelManager class."""
 
@@ -13,57 +82,44 @@ class TestChannelManager:
         """Test that ChannelManager creates channels file if it doesn't exist."""
         channels_file = temp_dir / "new_channels.json"
 
-        ChannelManager(channels_file=str(channels_file))
+        ChannelManager(channels_file=channels_file)
 
         assert channels_file.exists()
 
     def test_add_channel(self, temp_channels_file: Path):
         """Test adding a new channel."""
-        manager = ChannelManager(channels_file=str(temp_channels_file))
+        manager = ChannelManager(channels_file=temp_channels_file)
 
-        channel = manager.add_channel(
-            name="Test Channel",
-            url="https://www.youtube.com/@TestChannel",
-        )
+        channel = _add_test_channel(manager)
 
-        assert channel.name == "Test Channel"
-        assert channel.url == "https://www.youtube.com/@TestChannel"
+        assert channel.name == TEST_CHANNEL_NAME
+        assert channel.url == TEST_CHANNEL_URL
         assert channel.id is not None
         assert channel.enabled is True
 
     def test_add_channel_with_custom_format(self, temp_channels_file: Path):
         """Test adding a channel with custom download format."""
-        manager = ChannelManager(channels_file=str(temp_channels_file))
+        manager = ChannelManager(channels_file=temp_channels_file)
 
-        channel = manager.add_channel(
-            name="Test Channel",
-            url="https://www.youtube.com/@TestChannel",
-            download_format="bestvideo[height<=1080]+bestaudio",
-        )
+        channel = _add_test_channel(manager, download_format=CUSTOM_DOWNLOAD_FORMAT)
 
-        assert channel.download_format == "bestvideo[height<=1080]+bestaudio"
+        assert channel.download_format == CUSTOM_DOWNLOAD_FORMAT
 
     def test_add_channel_duplicate_url_raises_error(self, temp_channels_file: Path):
         """Test that adding duplicate URL raises ValueError."""
-        manager = ChannelManager(channels_file=str(temp_channels_file))
-        manager.add_channel(
-            name="Test Channel",
-            url="https://www.youtube.com/@TestChannel",
-        )
+        manager = ChannelManager(channels_file=temp_channels_file)
+        _add_test_channel(manager)
 
         with pytest.raises(ValueError, match="already exists"):
             manager.add_channel(
                 name="Another Channel",
-                url="https://www.youtube.com/@TestChannel",
+                url=TEST_CHANNEL_URL,
             )
 
     def test_remove_channel(self, temp_channels_file: Path):
         """Test removing a channel."""
-        manager = ChannelManager(channels_file=str(temp_channels_file))
-        channel = manager.add_channel(
-            name="Test Channel",
-            url="https://www.youtube.com/@TestChannel",
-        )
+        manager = ChannelManager(channels_file=temp_channels_file)
+        channel = _add_test_channel(manager)
 
         result = manager.remove_channel(channel.id)
 
@@ -72,71 +128,30 @@ class TestChannelManager:
 
     def test_remove_channel_not_found(self, temp_channels_file: Path):
         """Test removing a non-existent channel."""
-        manager = ChannelManager(channels_file=str(temp_channels_file))
+        manager = ChannelManager(channels_file=temp_channels_file)
 
         result = manager.remove_channel("nonexistent-id")
 
         assert result is False
 
-    def test_list_channels_enabled_only(self, temp_channels_file: Path):
-        """Test listing only enabled channels."""
-        manager = ChannelManager(channels_file=str(temp_channels_file))
-        manager.add_channel(
-            name="Enabled", url="https://www.youtube.com/@Enabled", enabled=True
-        )
-        manager.add_channel(
-            name="Disabled", url="https://www.youtube.com/@Disabled", enabled=False
-        )
-
-        channels = manager.list_channels(enabled_only=True)
-
-        assert len(channels) == 1
-        assert channels[0].name == "Enabled"
-
-    def test_get_channel(self, temp_channels_file: Path):
-        """Test getting a specific channel by ID."""
-        manager = ChannelManager(channels_file=str(temp_channels_file))
-        added_channel = manager.add_channel(
-            name="Test Channel",
-            url="https://www.youtube.com/@TestChannel",
-        )
-
-        channel = manager.get_channel(added_channel.id)
-
-        assert channel is not None
-        assert channel.id == added_channel.id
-        assert channel.name == "Test Channel"
-
-    def test_get_channel_not_found(self, temp_channels_file: Path):
-        """Test getting a non-existent channel."""
-        manager = ChannelManager(channels_file=str(temp_channels_file))
-
-        channel = manager.get_channel("nonexistent-id")
-
-        assert channel is None
-
     def test_update_channel(self, temp_channels_file: Path):
         """Test updating channel information."""
-        manager = ChannelManager(channels_file=str(temp_channels_file))
+        manager = ChannelManager(channels_file=temp_channels_file)
         channel = manager.add_channel(
             name="Original Name",
-            url="https://www.youtube.com/@TestChannel",
+            url=TEST_CHANNEL_URL,
         )
 
         updated = manager.update_channel(channel.id, name="Updated Name")
 
         assert updated is not None
         assert updated.name == "Updated Name"
-        assert updated.url == "https://www.youtube.com/@TestChannel"
+        assert updated.url == TEST_CHANNEL_URL
 
     def test_update_channel_enabled_status(self, temp_channels_file: Path):
         """Test updating channel enabled status."""
-        manager = ChannelManager(channels_file=str(temp_channels_file))
-        channel = manager.add_channel(
-            name="Test Channel",
-            url="https://www.youtube.com/@TestChannel",
-            enabled=True,
-        )
+        manager = ChannelManager(channels_file=temp_channels_file)
+        channel = _add_test_channel(manager, enabled=True)
 
         updated = manager.update_channel(channel.id, enabled=False)
 
@@ -147,7 +162,7 @@ class TestChannelManager:
         self, temp_channels_file: Path
     ):
         """URL uniqueness is a repository invariant for both add and update."""
-        manager = ChannelManager(channels_file=str(temp_channels_file))
+        manager = ChannelManager(channels_file=temp_channels_file)
         first = manager.add_channel(
             name="First",
             url="https://www.youtube.com/@First",
@@ -172,7 +187,7 @@ class TestChannelManager:
         self, temp_channels_file: Path
     ):
         """A rejected update must not leave channels.json in an invalid state."""
-        manager = ChannelManager(channels_file=str(temp_channels_file))
+        manager = ChannelManager(channels_file=temp_channels_file)
         channel = manager.add_channel(
             name="Original",
             url="https://www.youtube.com/@Original",
@@ -187,24 +202,15 @@ class TestChannelManager:
 
     def test_update_channel_not_found(self, temp_channels_file: Path):
         """Test updating a non-existent channel."""
-        manager = ChannelManager(channels_file=str(temp_channels_file))
+        manager = ChannelManager(channels_file=temp_channels_file)
 
         result = manager.update_channel("nonexistent-id", name="New Name")
 
         assert result is None
 
-    def test_get_global_settings(self, temp_channels_file: Path):
-        """Test getting global settings."""
-        manager = ChannelManager(channels_file=str(temp_channels_file))
-
-        settings = manager.get_global_settings()
-
-        assert settings.check_interval_seconds == 60
-        assert settings.split_mode == "time"
-
     def test_update_global_settings(self, temp_channels_file: Path):
         """Test updating global settings."""
-        manager = ChannelManager(channels_file=str(temp_channels_file))
+        manager = ChannelManager(channels_file=temp_channels_file)
 
         settings = manager.update_global_settings(
             check_interval_seconds=120,
@@ -218,7 +224,7 @@ class TestChannelManager:
         self, temp_channels_file: Path
     ):
         """Invalid settings must fail atomically instead of corrupting the file."""
-        manager = ChannelManager(channels_file=str(temp_channels_file))
+        manager = ChannelManager(channels_file=temp_channels_file)
 
         with pytest.raises(ValueError, match="at least 1"):
             manager.update_global_settings(check_interval_seconds=0)
@@ -230,7 +236,7 @@ class TestChannelManager:
         """동시에 add_channel을 호출해도 read-modify-write 레이스로 항목이 유실되면 안 된다."""
         import threading
 
-        manager = ChannelManager(channels_file=str(temp_channels_file))
+        manager = ChannelManager(channels_file=temp_channels_file)
 
         thread_count = 10
         barrier = threading.Barrier(thread_count)
@@ -257,15 +263,12 @@ class TestChannelManager:
 
     def test_persistence(self, temp_channels_file: Path):
         """Test that changes are persisted to file."""
-        manager1 = ChannelManager(channels_file=str(temp_channels_file))
-        manager1.add_channel(
-            name="Test Channel",
-            url="https://www.youtube.com/@TestChannel",
-        )
+        manager1 = ChannelManager(channels_file=temp_channels_file)
+        _add_test_channel(manager1)
 
         # Create new manager instance with same file
-        manager2 = ChannelManager(channels_file=str(temp_channels_file))
+        manager2 = ChannelManager(channels_file=temp_channels_file)
         channels = manager2.list_channels()
 
         assert len(channels) == 1
-        assert channels[0].name == "Test Channel"
+        assert channels[0].name == TEST_CHANNEL_NAME
@@ -1,24 +1,35 @@
 """Shared pytest fixtures for yt_monitor tests."""
 
 import json
-import shutil
-import tempfile
+import logging
 from pathlib import Path
 from typing import Generator
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 
 from src.yt_monitor.logging import Logger
+from tests.fakes import FakeYDL
+
+
+@pytest.fixture(autouse=True)
+def _no_sleep(monkeypatch: pytest.MonkeyPatch) -> None:
+    """테스트 전체에서 time.sleep을 no-op으로 바꿔 실제 대기를 없앤다.
+
+    sleep 호출 자체를 검증하는 테스트는 지금처럼 patch로 덮어쓰면 된다.
+    threading.Event.wait는 테스트 간 동기화(TestClient 포함)에 쓰이므로 건드리지 않는다.
+    """
+    monkeypatch.setattr("time.sleep", lambda *_args, **_kwargs: None)
 
 
 @pytest.fixture
-def temp_dir() -> Generator[Path, None, None]:
-    """Create a temporary directory for tests."""
-    tmpdir = tempfile.mkdtemp()
-    yield Path(tmpdir)
-    # Windows-safe cleanup: ignore errors on file deletion
-    shutil.rmtree(tmpdir, ignore_errors=True)
+def temp_dir(tmp_path: Path) -> Path:
+    """Per-test temporary directory.
+
+    pytest의 tmp_path를 그대로 쓴다 — 최근 3회 실행분만 남기고 정리하므로
+    테스트마다 rmtree를 돌지 않는다 (Windows 파일 잠금 재시도 비용 제거).
+    """
+    return tmp_path
 
 
 @pytest.fixture
@@ -27,20 +38,40 @@ def temp_log_file(temp_dir: Path) -> Path:
     return temp_dir / "test.log"
 
 
+@pytest.fixture(scope="session")
+def session_logger() -> Generator[None, None, None]:
+    """세션 끝에 공유 logger 상태를 한 번만 정리한다."""
+    yield
+    Logger.reset()
+
+
 @pytest.fixture
-def initialized_logger(temp_log_file: Path) -> Generator[None, None, None]:
-    """Initialize logger for tests and reset after."""
-    Logger._initialized = False
-    Logger._instance = None
-    Logger.initialize(str(temp_log_file))
+def initialized_logger(session_logger: None) -> Generator[None, None, None]:
+    """Ensure the shared logger is initialized (no-op when it already is).
+
+    공유 로그 내용을 검증하는 테스트는 없으므로 파일 없이 NullHandler만 단다.
+    로그 내용을 봐야 하는 테스트는 test_logging처럼 temp_log_file로 직접 초기화한다.
+    """
+    _ensure_logger()
     yield
-    # Close all handlers to release file locks on Windows
-    if Logger._instance:
-        for handler in Logger._instance.handlers[:]:
-            handler.close()
-            Logger._instance.removeHandler(handler)
-    Logger._initialized = False
-    Logger._instance = None
+
+
+@pytest.fixture(scope="class")
+def class_initialized_logger(session_logger: None) -> None:
+    """클래스 scope fixture가 Logger.get()을 쓸 수 있도록 한 번 보장한다."""
+    _ensure_logger()
+
+
+def _ensure_logger() -> None:
+    # test_logging 등이 Logger.reset()을 호출했을 수 있으므로 필요할 때만 다시 단다.
+    # Logger.initialize()는 파일/콘솔 handler를 열므로 싱글톤 상태를 직접 채운다.
+    if Logger._initialized:
+        return
+    logger = logging.getLogger("yt_monitor")
+    logger.setLevel(logging.INFO)
+    logger.handlers[:] = [logging.NullHandler()]
+    Logger._instance = logger
+    Logger._initialized = True
 
 
 @pytest.fixture
@@ -58,19 +89,41 @@ def temp_channels_file(temp_dir: Path) -> Path:
             "split_size_mb": 500,
         },
     }
-    with open(channels_file, "w", encoding="utf-8") as f:
-        json.dump(default_data, f)
+    channels_file.write_text(
+        json.dumps(default_data, separators=(",", ":")), encoding="utf-8"
+    )
     return channels_file
 
 
+@pytest.fixture
+def mock_ydl(monkeypatch: pytest.MonkeyPatch) -> FakeYDL:
+    """yt_dlp.YoutubeDL을 context manager로 동작하는 단일 stub 인스턴스로 교체한다.
+
+    반환값은 `with yt_dlp.YoutubeDL(opts) as ydl:`의 ydl — extract_info/download를
+    테스트에서 직접 설정한다. 생성자 호출은 `mock_ydl.ydl_class`로 확인한다.
+    """
+    fake_ydl = FakeYDL()
+    monkeypatch.setattr("yt_dlp.YoutubeDL", fake_ydl.ydl_class)
+    return fake_ydl
+
+
+class _FakeHTTPResponse:
+    """`with urllib.request.urlopen(...) as response:`용 경량 stub — headers만 쓴다."""
+
+    def __init__(self) -> None:
+        self.headers: dict = {}
+
+    def __enter__(self) -> "_FakeHTTPResponse":
+        return self
+
+    def __exit__(self, *exc_info) -> bool:
+        return False
+
+
 @pytest.fixture
 def discord_mock_urlopen():
     """Discord Webhook urlopen mock — urllib 호출을 가로채는 공용 fixture."""
-    mock_response = MagicMock()
-    mock_response.headers = {}
-    mock_response.__enter__ = lambda s: mock_response
-    mock_response.__exit__ = MagicMock(return_value=False)
-    with patch("urllib.request.urlopen", return_value=mock_response) as mock_open:
+    with patch("urllib.request.urlopen", return_value=_FakeHTTPResponse()) as mock_open:
         yield mock_open
 
 
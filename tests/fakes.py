@@ -0,0 +1,22 @@
+"""테스트 간 공유하는 경량 stub. fixture가 반환하는 타입을 테스트 annotation에서도 쓴다."""
+
+from unittest.mock import Mock
+
+
+class FakeYDL:
+    """`with yt_dlp.YoutubeDL(opts) as ydl:`용 경량 stub.
+
+    테스트가 쓰는 속성은 extract_info/download뿐이라 MagicMock의 매직 메서드
+    합성 없이 plain class + Mock 두 개로 충분하다.
+    """
+
+    def __init__(self) -> None:
+        self.extract_info = Mock()
+        self.download = Mock()
+        self.ydl_class = Mock(return_value=self)
+
+    def __enter__(self) -> "FakeYDL":
+        return self
+
+    def __exit__(self, *exc_info) -> bool:
+        return False
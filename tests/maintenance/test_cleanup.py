@@ -96,3 +96,43 @@ def test_cleanup_summary_counts_only_expired_files_and_reports_live_usage(
     assert summary["retention_days"] == 7
     assert summary["live_files_preserved"] == 1
     assert summary["live_size_mb"] == pytest.approx(5 / (1024 * 1024))
+
+
+def test_scan_walks_tree_once_for_summary_and_old_files(
+    tmp_path: Path, initialized_logger
+):
+    root = tmp_path / "downloads"
+    old = root / "nested" / "old.mp4"
+    _write_file_with_age(old, age_days=9, content=b"old!")
+    _write_file_with_age(root / "live" / "kept.mp4", age_days=30)
+
+    with (
+        patch("src.yt_monitor.maintenance.cleanup.time.time", return_value=NOW),
+        patch(
+            "src.yt_monitor.maintenance.cleanup.os.scandir",
+            wraps=os.scandir,
+        ) as scandir,
+    ):
+        summary, old_files = FileCleaner(str(root), retention_days=7).scan()
+
+    assert [path for path, _age in old_files] == [old]
+    assert summary["files_to_delete"] == 1
+    assert summary["total_size_bytes"] == 4
+    assert summary["live_files_preserved"] == 1
+    assert scandir.call_count == 3
+
+
+def test_cleanup_prunes_nested_empty_directories_but_keeps_live_tree(
+    tmp_path: Path, initialized_logger
+):
+    root = tmp_path / "downloads"
+    old = root / "a" / "b" / "old.mp4"
+    _write_file_with_age(old, age_days=9)
+    (root / "live" / "channel").mkdir(parents=True)
+
+    with patch("src.yt_monitor.maintenance.cleanup.time.time", return_value=NOW):
+        FileCleaner(str(root), retention_days=7).cleanup()
+
+    assert not (root / "a").exists()
+    assert (root / "live" / "channel").is_dir()
+    assert root.is_dir()
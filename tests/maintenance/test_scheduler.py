@@ -27,10 +27,11 @@ class TestCleanupSchedulerRunOnce:
     ):
         mock_cleaner_cls = MagicMock()
         mock_cleaner_instance = MagicMock()
-        mock_cleaner_instance.get_cleanup_summary.return_value = {
-            "files_to_delete": 3,
-            "total_size_mb": 5.0,
-        }
+        old_files = [(Path("old.mp4"), 8.0)]
+        mock_cleaner_instance.scan.return_value = (
+            {"files_to_delete": 3, "total_size_mb": 5.0},
+            old_files,
+        )
         mock_cleaner_cls.return_value = mock_cleaner_instance
 
         scheduler = CleanupScheduler(channel_manager=mock_channel_manager)
@@ -41,17 +42,19 @@ class TestCleanupSchedulerRunOnce:
             scheduler.run_once()
 
         mock_cleaner_cls.assert_called_once()
-        mock_cleaner_instance.cleanup.assert_called_once_with(dry_run=False)
+        mock_cleaner_instance.cleanup.assert_called_once_with(
+            dry_run=False, old_files=old_files
+        )
 
     def test_run_once_skips_cleanup_when_no_files(
         self, mock_channel_manager: MagicMock, initialized_logger
     ):
         mock_cleaner_cls = MagicMock()
         mock_cleaner_instance = MagicMock()
-        mock_cleaner_instance.get_cleanup_summary.return_value = {
-            "files_to_delete": 0,
-            "total_size_mb": 0.0,
-        }
+        mock_cleaner_instance.scan.return_value = (
+            {"files_to_delete": 0, "total_size_mb": 0.0},
+            [],
+        )
         mock_cleaner_cls.return_value = mock_cleaner_instance
 
         scheduler = CleanupScheduler(channel_manager=mock_channel_manager)
@@ -63,6 +66,25 @@ class TestCleanupSchedulerRunOnce:
 
         mock_cleaner_instance.cleanup.assert_not_called()
 
+    def test_run_once_reuses_cleaner_until_download_directory_changes(
+        self, mock_channel_manager: MagicMock, initialized_logger, tmp_path: Path
+    ):
+        scheduler = CleanupScheduler(channel_manager=mock_channel_manager)
+
+        scheduler.run_once()
+        first_cleaner = scheduler._cleaner
+        scheduler.run_once()
+        assert scheduler._cleaner is first_cleaner
+
+        mock_channel_manager.get_global_settings.return_value = GlobalSettingsDTO(
+            download_directory=str(tmp_path / "moved"),
+            log_file=str(tmp_path / "test.log"),
+        )
+        scheduler.run_once()
+
+        assert scheduler._cleaner is not first_cleaner
+        assert scheduler._cleaner.download_directory == tmp_path / "moved"
+
 
 class TestCleanupSchedulerLifecycle:
     """start()/stop() — 스레드 생명주기."""
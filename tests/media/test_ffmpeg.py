@@ -42,6 +42,8 @@ class TestBuildSegmentCommandSingleStream:
 
         assert command == [
             "ffmpeg",
+            "-hide_banner",
+            "-nostats",
             "-headers",
             "User-Agent: x\r\n",
             "-i",
@@ -82,6 +84,8 @@ class TestBuildSegmentCommandDualStream:
 
         assert command == [
             "ffmpeg",
+            "-hide_banner",
+            "-nostats",
             "-headers",
             "User-Agent: v-agent\r\n",
             "-i",
@@ -1,31 +1,53 @@
 """Tests for stream_downloader module."""
 
+import io
+import re
 import subprocess
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from typing import Generator
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
 from src.yt_monitor.media.stream_download import StreamDownloader
+from tests.fakes import FakeYDL
+
+
+def _ffmpeg_options(argv: list[str]) -> dict[str, str]:
+    """ffmpeg argv를 한 번 훑어 `-flag value` 쌍을 dict로 만든다 (반복 flag는 첫 값)."""
+    options: dict[str, str] = {}
+    for flag, value in zip(argv, argv[1:]):
+        if flag.startswith("-") and not value.startswith("-"):
+            options.setdefault(flag, value)
+    return options
 
 
 class TestStreamDownloader:
     """Test cases for StreamDownloader class."""
 
     @pytest.fixture
-    def stream_downloader(self, temp_dir: Path, initialized_logger) -> StreamDownloader:
+    def stream_downloader(self, tmp_path: Path, initialized_logger) -> StreamDownloader:
         """Create StreamDownloader instance for testing."""
         return StreamDownloader(
-            download_directory=str(temp_dir / "downloads"),
+            download_directory=str(tmp_path / "downloads"),
             download_format="bestvideo+bestaudio/best",
             split_mode="time",
             split_time_minutes=30,
             split_size_mb=500,
         )
 
-    def test_init_creates_download_directory(self, temp_dir: Path, initialized_logger):
+    @pytest.fixture
+    def ffmpeg_popen(self) -> Generator[Mock, None, None]:
+        """subprocess.Popen을 막고, 정상 종료하는 ffmpeg 프로세스 mock을 돌려준다."""
+        proc = Mock(spec=subprocess.Popen)
+        proc.stderr = io.StringIO("")
+        proc.wait.return_value = 0
+        with patch("subprocess.Popen", return_value=proc) as popen:
+            yield popen
+
+    def test_init_creates_download_directory(self, tmp_path: Path, initialized_logger):
         """Test that __init__ creates the download directory."""
-        download_dir = temp_dir / "new_downloads"
+        download_dir = tmp_path / "nested" / "new_downloads"
 
         StreamDownloader(
             download_directory=str(download_dir),
@@ -47,35 +69,32 @@ class TestStreamDownloader:
         assert opts["wait_for_video"] == (5, 20)
         assert opts["postprocessors"][0]["key"] == "FFmpegVideoConvertor"
 
-    def test_download_no_split_mode(self, temp_dir: Path, initialized_logger):
-        """Test download with split_mode='none'."""
+    @pytest.mark.parametrize(
+        ("split_mode", "download_method"),
+        [
+            ("none", "_perform_download"),
+            ("time", "_download_with_realtime_split"),
+            ("size", "_download_with_realtime_split"),
+        ],
+    )
+    def test_download_dispatches_by_split_mode(
+        self, tmp_path: Path, initialized_logger, split_mode: str, download_method: str
+    ):
+        """split_mode에 따라 단일 다운로드 또는 실시간 분할 경로로 보낸다."""
         downloader = StreamDownloader(
-            download_directory=str(temp_dir),
+            download_directory=str(tmp_path),
             download_format="bestvideo+bestaudio/best",
-            split_mode="none",
+            split_mode=split_mode,
         )
 
-        with patch.object(downloader, "_perform_download") as mock_download:
+        with patch.object(downloader, download_method) as mock_download:
             result = downloader.download(
                 "https://www.youtube.com/watch?v=test123",
                 filename_prefix="test",
             )
 
-            assert result is True
-            mock_download.assert_called_once()
-
-    def test_download_time_split_mode(self, stream_downloader: StreamDownloader):
-        """Test download with split_mode='time'."""
-        with patch.object(
-            stream_downloader, "_download_with_realtime_split"
-        ) as mock_split:
-            result = stream_downloader.download(
-                "https://www.youtube.com/watch?v=test123",
-                filename_prefix="test",
-            )
-
-            assert result is True
-            mock_split.assert_called_once()
+        assert result is True
+        mock_download.assert_called_once()
 
     def test_download_failure_returns_false(self, stream_downloader: StreamDownloader):
         """Test that download returns False on failure."""
@@ -109,67 +128,79 @@ class TestStreamDownloader:
 
             assert "mystream" in output_pattern
             assert "part%03d.mp4" in output_pattern
+            assert re.search(r"mystream_\d{8}_\d{6}_part%03d\.mp4$", output_pattern)
 
     def test_download_with_realtime_split_time_mode(
-        self, stream_downloader: StreamDownloader
+        self, stream_downloader: StreamDownloader, mock_ydl: FakeYDL, ffmpeg_popen: Mock
     ):
         """Test _download_with_realtime_split calculates correct split time."""
         stream_downloader.split_mode = "time"
         stream_downloader.split_time_minutes = 10
+        mock_ydl.extract_info.return_value = {
+            "url": "https://direct-url.com/stream",
+            "http_headers": {"User-Agent": "Mozilla/5.0"},
+        }
+
+        stream_downloader._download_with_realtime_split(
+            "https://www.youtube.com/watch?v=test123",
+            "/output/pattern_%03d.mp4",
+        )
+
+        # Verify ffmpeg was called with correct segment time (10 * 60 = 600)
+        call_args = ffmpeg_popen.call_args[0][0]
+        assert _ffmpeg_options(call_args)["-segment_time"] == "600"
+        header_idx = call_args.index("-headers")
+        input_idx = call_args.index("-i")
+        assert header_idx < input_idx
 
-        with patch("yt_dlp.YoutubeDL") as mock_ydl:
-            mock_instance = MagicMock()
-            mock_instance.__enter__ = MagicMock(return_value=mock_instance)
-            mock_instance.__exit__ = MagicMock(return_value=False)
-            mock_instance.extract_info.return_value = {
-                "url": "https://direct-url.com/stream",
-                "http_headers": {"User-Agent": "Mozilla/5.0"},
-            }
-            mock_ydl.return_value = mock_instance
-
-            with patch("subprocess.Popen") as mock_popen:
-                mock_proc = MagicMock()
-                mock_proc.communicate.return_value = ("", "")
-                mock_proc.returncode = 0
-                mock_popen.return_value = mock_proc
+    def test_download_with_realtime_split_ffmpeg_failure(
+        self, stream_downloader: StreamDownloader, mock_ydl: FakeYDL, ffmpeg_popen: Mock
+    ):
+        """Test _download_with_realtime_split raises on ffmpeg failure."""
+        mock_ydl.extract_info.return_value = {"url": "https://direct-url.com/stream"}
+        ffmpeg_popen.return_value.stderr = io.StringIO("ffmpeg error detail\n")
+        ffmpeg_popen.return_value.wait.return_value = 1
 
+        with pytest.raises(
+            Exception, match="FFmpeg segmented download failed.*ffmpeg error detail"
+        ):
+            stream_downloader._download_with_realtime_split(
+                "https://www.youtube.com/watch?v=test123",
+                "/output/pattern_%03d.mp4",
+            )
+
+    def test_download_with_realtime_split_failure_without_stderr(
+        self, stream_downloader: StreamDownloader, mock_ydl: FakeYDL, ffmpeg_popen: Mock
+    ):
+        """stderr가 비어 있으면 예외 메시지에 `: ` 꼬리를 붙이지 않는다."""
+        mock_ydl.extract_info.return_value = {"url": "https://direct-url.com/stream"}
+        ffmpeg_popen.return_value.wait.return_value = 1
+
+        with pytest.raises(Exception, match=r"^FFmpeg segmented download failed \(rc=1\)$"):
+            stream_downloader._download_with_realtime_split(
+                "https://www.youtube.com/watch?v=test123",
+                "/output/pattern_%03d.mp4",
+            )
+
+    def test_download_with_realtime_split_logs_only_stderr_tail(
+        self, stream_downloader: StreamDownloader, mock_ydl: FakeYDL, ffmpeg_popen: Mock
+    ):
+        """ffmpeg stderr는 흘려 읽고, 실패 로그에는 마지막 줄들만 남긴다."""
+        mock_ydl.extract_info.return_value = {"url": "https://direct-url.com/stream"}
+        lines = "".join(f"warning {i}\n" for i in range(500))
+        ffmpeg_popen.return_value.stderr = io.StringIO(lines + "fatal: broken pipe\n")
+        ffmpeg_popen.return_value.wait.return_value = 1
+
+        with patch.object(stream_downloader.logger, "error") as mock_error:
+            with pytest.raises(Exception, match="rc=1.*fatal: broken pipe$"):
                 stream_downloader._download_with_realtime_split(
                     "https://www.youtube.com/watch?v=test123",
                     "/output/pattern_%03d.mp4",
                 )
 
-                # Verify ffmpeg was called with correct segment time (10 * 60 = 600)
-                call_args = mock_popen.call_args[0][0]
-                segment_time_idx = call_args.index("-segment_time")
-                assert call_args[segment_time_idx + 1] == "600"
-                header_idx = call_args.index("-headers")
-                input_idx = call_args.index("-i")
-                assert header_idx < input_idx
-
-    def test_download_with_realtime_split_ffmpeg_failure(
-        self, stream_downloader: StreamDownloader
-    ):
-        """Test _download_with_realtime_split raises on ffmpeg failure."""
-        with patch("yt_dlp.YoutubeDL") as mock_ydl:
-            mock_instance = MagicMock()
-            mock_instance.__enter__ = MagicMock(return_value=mock_instance)
-            mock_instance.__exit__ = MagicMock(return_value=False)
-            mock_instance.extract_info.return_value = {
-                "url": "https://direct-url.com/stream"
-            }
-            mock_ydl.return_value = mock_instance
-
-            with patch("subprocess.Popen") as mock_popen:
-                mock_proc = MagicMock()
-                mock_proc.communicate.return_value = ("", "ffmpeg error detail")
-                mock_proc.returncode = 1
-                mock_popen.return_value = mock_proc
-
-                with pytest.raises(Exception, match="FFmpeg segmented download failed"):
-                    stream_downloader._download_with_realtime_split(
-                        "https://www.youtube.com/watch?v=test123",
-                        "/output/pattern_%03d.mp4",
-                    )
+        message = mock_error.call_args[0][0]
+        assert "fatal: broken pipe" in message
+        assert "warning 0\n" not in message
 
     def test_stop_terminates_running_ffmpeg(self, stream_downloader: StreamDownloader):
         """stop()은 진행 중인 ffmpeg에 terminate 후 wait를 호출한다."""
@@ -217,19 +248,16 @@ class TestStreamDownloader:
 
         assert stream_downloader._proc is None
 
-    def test_perform_download(self, stream_downloader: StreamDownloader):
+    def test_perform_download(
+        self, stream_downloader: StreamDownloader, mock_ydl: FakeYDL
+    ):
         """Test _perform_download calls yt-dlp correctly."""
-        with patch("yt_dlp.YoutubeDL") as mock_ydl:
-            mock_instance = MagicMock()
-            mock_instance.__enter__ = MagicMock(return_value=mock_instance)
-            mock_instance.__exit__ = MagicMock(return_value=False)
-            mock_ydl.return_value = mock_instance
-
-            stream_downloader._perform_download(
-                "https://www.youtube.com/watch?v=test123",
-                {"format": "best"},
-            )
+        stream_downloader._perform_download(
+            "https://www.youtube.com/watch?v=test123",
+            {"format": "best"},
+        )
 
-            mock_instance.download.assert_called_once_with(
-                ["https://www.youtube.com/watch?v=test123"]
-            )
+        mock_ydl.ydl_class.assert_called_once_with({"format": "best"})
+        mock_ydl.download.assert_called_once_with(
+            ["https://www.youtube.com/watch?v=test123"]
+        )
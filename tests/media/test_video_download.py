@@ -1,34 +1,45 @@
 """Tests for video_downloader module."""
 
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from typing import Optional
+from unittest.mock import patch
 
+import pytest
 
 from src.yt_monitor.media.video_download import VideoDownloader
+from tests.fakes import FakeYDL
 
 
 class TestVideoDownloader:
     """Test cases for VideoDownloader class."""
 
-    def test_init_creates_output_directory(self, temp_dir: Path):
+    def test_init_creates_output_directory(self, tmp_path: Path):
         """Test that __init__ creates the output directory."""
-        output_dir = temp_dir / "downloads"
+        output_dir = tmp_path / "nested" / "downloads"
 
         VideoDownloader(output_dir=str(output_dir))
 
         assert output_dir.exists()
 
-    def test_get_format_string_audio_only(self, temp_dir: Path):
+    def test_init_skips_mkdir_for_existing_directory(self, tmp_path: Path):
+        """이미 있는 디렉토리면 mkdir 없이 stat만 한다."""
+        with patch("pathlib.Path.mkdir") as mkdir:
+            for _ in range(3):
+                VideoDownloader(output_dir=str(tmp_path))
+
+        mkdir.assert_not_called()
+
+    def test_get_format_string_audio_only(self, tmp_path: Path):
         """Test _get_format_string for audio only mode."""
-        downloader = VideoDownloader(output_dir=str(temp_dir), audio_only=True)
+        downloader = VideoDownloader(output_dir=str(tmp_path), audio_only=True)
 
         format_string = downloader._get_format_string()
 
         assert format_string == "bestaudio/best"
 
-    def test_get_format_string_best_quality(self, temp_dir: Path):
+    def test_get_format_string_best_quality(self, tmp_path: Path):
         """Test _get_format_string for best quality."""
-        downloader = VideoDownloader(output_dir=str(temp_dir), quality="best")
+        downloader = VideoDownloader(output_dir=str(tmp_path), quality="best")
 
         format_string = downloader._get_format_string()
 
@@ -36,20 +47,21 @@ class TestVideoDownloader:
             "bestvideo+bestaudio[ext=m4a]/bestvideo+bestaudio/best"
         )
 
-    def test_get_format_string_specific_quality(self, temp_dir: Path):
-        """Test _get_format_string for specific quality."""
-        downloader = VideoDownloader(output_dir=str(temp_dir), quality="720")
+    @pytest.mark.parametrize("quality", ["2160", "1440", "1080", "720", "480", "360"])
+    def test_get_format_string_specific_quality(self, tmp_path: Path, quality: str):
+        """Test _get_format_string for each specific quality."""
+        downloader = VideoDownloader(output_dir=str(tmp_path), quality=quality)
 
         format_string = downloader._get_format_string()
 
         assert format_string == (
-            "bestvideo[height<=720]+bestaudio[ext=m4a]/"
-            "bestvideo[height<=720]+bestaudio/best[height<=720]"
+            f"bestvideo[height<={quality}]+bestaudio[ext=m4a]/"
+            f"bestvideo[height<={quality}]+bestaudio/best[height<={quality}]"
         )
 
-    def test_build_ydl_options_video(self, temp_dir: Path):
+    def test_build_ydl_options_video(self, tmp_path: Path):
         """Test _build_ydl_options for video download."""
-        downloader = VideoDownloader(output_dir=str(temp_dir))
+        downloader = VideoDownloader(output_dir=str(tmp_path))
 
         opts = downloader._build_ydl_options("/path/to/output.mp4")
 
@@ -70,9 +82,9 @@ class TestVideoDownloader:
             "48000",
         ]
 
-    def test_build_ydl_options_audio(self, temp_dir: Path):
+    def test_build_ydl_options_audio(self, tmp_path: Path):
         """Test _build_ydl_options for audio download."""
-        downloader = VideoDownloader(output_dir=str(temp_dir), audio_only=True)
+        downloader = VideoDownloader(output_dir=str(tmp_path), audio_only=True)
 
         opts = downloader._build_ydl_options("/path/to/output.mp3")
 
@@ -81,119 +93,121 @@ class TestVideoDownloader:
         assert opts["postprocessors"][0]["key"] == "FFmpegExtractAudio"
         assert opts["postprocessors"][0]["preferredcodec"] == "mp3"
 
-    def test_download_success(self, temp_dir: Path):
-        """Test successful download."""
-        downloader = VideoDownloader(output_dir=str(temp_dir))
+    def test_build_ydl_options_scales_fragment_concurrency(self, tmp_path: Path):
+        """프래그먼트 병렬 수는 CPU 수에 맞추되 2~16 사이로 제한된다."""
+        downloader = VideoDownloader(output_dir=str(tmp_path))
 
-        with patch("yt_dlp.YoutubeDL") as mock_ydl:
-            mock_instance = MagicMock()
-            mock_instance.__enter__ = MagicMock(return_value=mock_instance)
-            mock_instance.__exit__ = MagicMock(return_value=False)
-            mock_instance.extract_info.return_value = {
-                "title": "Test Video",
-                "duration": 120,
-            }
-            mock_ydl.return_value = mock_instance
+        opts = downloader._build_ydl_options("/path/to/output.mp4")
 
-            result = downloader.download("https://www.youtube.com/watch?v=test123")
+        assert 2 <= opts["concurrent_fragment_downloads"] <= 16
+
+    def test_build_ydl_options_returns_independent_copies(self, tmp_path: Path):
+        """반환된 옵션을 고쳐도 다음 호출의 템플릿은 그대로다."""
+        downloader = VideoDownloader(output_dir=str(tmp_path))
+
+        first = downloader._build_ydl_options("/path/to/a.mp4")
+        first["quiet"] = True
+        first["postprocessors"].clear()
+        second = downloader._build_ydl_options("/path/to/b.mp4")
+
+        assert second["quiet"] is False
+        assert len(second["postprocessors"]) == 2
+
+    @pytest.mark.parametrize(
+        ("audio_only", "filename", "expected_suffix"),
+        [
+            (False, None, ".mp4"),
+            (False, "custom_name", "custom_name.mp4"),
+            (True, None, ".mp3"),
+        ],
+        ids=["default", "custom_filename", "audio_only"],
+    )
+    def test_download_variants(
+        self,
+        tmp_path: Path,
+        mock_ydl: FakeYDL,
+        audio_only: bool,
+        filename: Optional[str],
+        expected_suffix: str,
+    ):
+        """download()는 성공 시 True이고 outtmpl에 파일명/확장자를 반영한다."""
+        downloader = VideoDownloader(output_dir=str(tmp_path), audio_only=audio_only)
+        mock_ydl.extract_info.return_value = {"title": "Test Video", "duration": 120}
+
+        result = downloader.download(
+            "https://www.youtube.com/watch?v=test123", filename=filename
+        )
 
-            assert result is True
-            mock_instance.download.assert_called_once()
+        assert result is True
+        mock_ydl.extract_info.assert_called_once_with(
+            "https://www.youtube.com/watch?v=test123", download=True
+        )
+        mock_ydl.download.assert_not_called()
+        opts = mock_ydl.ydl_class.call_args[0][0]
+        assert opts["outtmpl"].endswith(expected_suffix)
 
-    def test_download_failure(self, temp_dir: Path):
+    def test_download_failure(self, tmp_path: Path, mock_ydl: FakeYDL):
         """Test download failure."""
-        downloader = VideoDownloader(output_dir=str(temp_dir))
-
-        with patch("yt_dlp.YoutubeDL") as mock_ydl:
-            mock_instance = MagicMock()
-            mock_instance.__enter__ = MagicMock(return_value=mock_instance)
-            mock_instance.__exit__ = MagicMock(return_value=False)
-            mock_instance.extract_info.side_effect = Exception("Download failed")
-            mock_ydl.return_value = mock_instance
-
-            result = downloader.download("https://www.youtube.com/watch?v=test123")
-
-            assert result is False
-
-    def test_download_with_custom_filename(self, temp_dir: Path):
-        """Test download with custom filename."""
-        downloader = VideoDownloader(output_dir=str(temp_dir))
-
-        with patch("yt_dlp.YoutubeDL") as mock_ydl:
-            mock_instance = MagicMock()
-            mock_instance.__enter__ = MagicMock(return_value=mock_instance)
-            mock_instance.__exit__ = MagicMock(return_value=False)
-            mock_instance.extract_info.return_value = {
-                "title": "Test Video",
-                "duration": 120,
-            }
-            mock_ydl.return_value = mock_instance
-
-            result = downloader.download(
-                "https://www.youtube.com/watch?v=test123",
-                filename="custom_name",
-            )
-
-            assert result is True
-            # Verify the custom filename was used in options
-            call_args = mock_ydl.call_args
-            opts = call_args[0][0]
-            assert "custom_name" in opts["outtmpl"]
-
-    def test_download_audio_only_uses_mp3_extension(self, temp_dir: Path):
-        """Test that audio only download uses .mp3 extension."""
-        downloader = VideoDownloader(output_dir=str(temp_dir), audio_only=True)
-
-        with patch("yt_dlp.YoutubeDL") as mock_ydl:
-            mock_instance = MagicMock()
-            mock_instance.__enter__ = MagicMock(return_value=mock_instance)
-            mock_instance.__exit__ = MagicMock(return_value=False)
-            mock_instance.extract_info.return_value = {
-                "title": "Test Video",
-                "duration": 120,
-            }
-            mock_ydl.return_value = mock_instance
-
-            downloader.download("https://www.youtube.com/watch?v=test123")
-
-            call_args = mock_ydl.call_args
-            opts = call_args[0][0]
-            assert opts["outtmpl"].endswith(".mp3")
-
-    def test_get_video_info(self, temp_dir: Path):
+        downloader = VideoDownloader(output_dir=str(tmp_path))
+        mock_ydl.extract_info.side_effect = Exception("Download failed")
+
+        result = downloader.download("https://www.youtube.com/watch?v=test123")
+
+        assert result is False
+
+    def test_get_video_info(self, tmp_path: Path, mock_ydl: FakeYDL):
         """Test get_video_info returns correct information."""
-        downloader = VideoDownloader(output_dir=str(temp_dir))
-
-        with patch("yt_dlp.YoutubeDL") as mock_ydl:
-            mock_instance = MagicMock()
-            mock_instance.__enter__ = MagicMock(return_value=mock_instance)
-            mock_instance.__exit__ = MagicMock(return_value=False)
-            mock_instance.extract_info.return_value = {
-                "title": "Test Video",
-                "duration": 300,
-                "uploader": "Test Channel",
-                "view_count": 1000,
-                "upload_date": "20240101",
-                "description": "Test description",
-                "thumbnail": "https://example.com/thumb.jpg",
-                "formats": [
-                    {
-                        "format_id": "22",
-                        "ext": "mp4",
-                        "resolution": "720p",
-                        "filesize": 1000000,
-                    }
-                ],
-            }
-            mock_ydl.return_value = mock_instance
-
-            info = downloader.get_video_info("https://www.youtube.com/watch?v=test123")
-
-            assert info["title"] == "Test Video"
-            assert info["duration"] == 300
-            assert info["uploader"] == "Test Channel"
-            assert info["view_count"] == 1000
-            assert len(info["formats"]) == 1
-            mock_instance.extract_info.assert_called_once_with(
-                "https://www.youtube.com/watch?v=test123", download=False
-            )
+        downloader = VideoDownloader(output_dir=str(tmp_path))
+        mock_ydl.extract_info.return_value = {
+            "title": "Test Video",
+            "duration": 300,
+            "uploader": "Test Channel",
+            "view_count": 1000,
+            "upload_date": "20240101",
+            "description": "Test description",
+            "thumbnail": "https://example.com/thumb.jpg",
+            "formats": [
+                {
+                    "format_id": "22",
+                    "ext": "mp4",
+                    "resolution": "720p",
+                    "filesize": 1000000,
+                }
+            ],
+        }
+
+        info = downloader.get_video_info("https://www.youtube.com/watch?v=test123")
+
+        assert info["title"] == "Test Video"
+        assert info["duration"] == 300
+        assert info["uploader"] == "Test Channel"
+        assert info["view_count"] == 1000
+        assert len(info["formats"]) == 1
+        mock_ydl.extract_info.assert_called_once_with(
+            "https://www.youtube.com/watch?v=test123", download=False
+        )
+
+    def test_get_video_info_fast_skips_player_js(
+        self, tmp_path: Path, mock_ydl: FakeYDL, monkeypatch: pytest.MonkeyPatch
+    ):
+        """fast=True면 player JS/DASH/HLS 조회를 끄고 format 없음 오류를 무시한다."""
+        pot_args = {"youtubepot-bgutilhttp": {"base_url": ["http://pot:4416"]}}
+        monkeypatch.setattr(
+            "src.yt_monitor.media.video_download.get_cookie_options",
+            lambda: {"extractor_args": pot_args},
+        )
+        downloader = VideoDownloader(output_dir=str(tmp_path))
+        mock_ydl.extract_info.return_value = {"title": "Test Video"}
+
+        info = downloader.get_video_info(
+            "https://www.youtube.com/watch?v=test123", fast=True
+        )
+
+        opts = mock_ydl.ydl_class.call_args[0][0]
+        assert opts["extractor_args"]["youtube"]["player_skip"] == ["js", "configs"]
+        assert opts["extractor_args"]["youtubepot-bgutilhttp"] == pot_args[
+            "youtubepot-bgutilhttp"
+        ]
+        assert opts["ignore_no_formats_error"] is True
+        assert info["title"] == "Test Video"
+        assert info["formats"] == []
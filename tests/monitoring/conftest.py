@@ -1,14 +1,13 @@
 """Shared fixtures for monitoring service and worker tests."""
 
-from pathlib import Path
-
 import pytest
 
 from src.yt_monitor.channels.models import ChannelDTO, GlobalSettingsDTO
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_channel() -> ChannelDTO:
+    """읽기 전용으로만 쓰이므로 세션 전체가 한 인스턴스를 공유한다."""
     return ChannelDTO(
         id="test-channel-id",
         name="Test Channel",
@@ -17,12 +16,14 @@ def sample_channel() -> ChannelDTO:
     )
 
 
-@pytest.fixture
-def global_settings(temp_dir: Path) -> GlobalSettingsDTO:
+@pytest.fixture(scope="session")
+def global_settings(tmp_path_factory: pytest.TempPathFactory) -> GlobalSettingsDTO:
+    """frozen DTO라 세션 공유가 안전하다 — 경로가 테스트별로 달라야 하면 replace()로 바꾼다."""
+    root = tmp_path_factory.mktemp("monitoring")
     return GlobalSettingsDTO(
         check_interval_seconds=1,
-        download_directory=str(temp_dir / "downloads"),
-        log_file=str(temp_dir / "test.log"),
+        download_directory=str(root / "downloads"),
+        log_file=str(root / "test.log"),
         split_mode="time",
         split_time_minutes=30,
     )
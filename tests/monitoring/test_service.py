@@ -1,28 +1,51 @@
 """Multi-channel monitoring service contracts."""
 
+import threading
 from pathlib import Path
-from typing import cast
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from typing import Sequence
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
 from src.yt_monitor.channels.models import ChannelDTO, GlobalSettingsDTO
-from src.yt_monitor.channels.repository import ChannelManager
+from src.yt_monitor.monitoring import service as service_module
 from src.yt_monitor.monitoring.service import MultiChannelMonitor
 
+
+_SINGLE_CHANNEL = ChannelDTO(
+    id="ch1",
+    name="Test Channel",
+    url="https://www.youtube.com/@TestChannel",
+)
+
+
+def _stub_channel_manager(
+    root: Path, channels: Sequence[ChannelDTO] = ()
+) -> SimpleNamespace:
+    """MultiChannelMonitor가 쓰는 메서드만 Mock으로 가진 ChannelManager stub.
+
+    MagicMock(spec=ChannelManager)처럼 클래스를 introspect하지 않는다.
+    """
+    return SimpleNamespace(
+        list_channels=Mock(return_value=list(channels)),
+        count_channels=Mock(return_value=(len(channels), len(channels))),
+        get_global_settings=Mock(
+            return_value=GlobalSettingsDTO(
+                download_directory=str(root / "downloads"),
+                log_file=str(root / "test.log"),
+            )
+        ),
+    )
+
+
 class TestMultiChannelMonitor:
     """Test cases for MultiChannelMonitor class."""
 
     @pytest.fixture
-    def mock_channel_manager(self, temp_dir: Path) -> MagicMock:
+    def mock_channel_manager(self, temp_dir: Path) -> SimpleNamespace:
         """Create mock channel manager."""
-        manager = MagicMock(spec=ChannelManager)
-        manager.list_channels.return_value = []
-        manager.get_global_settings.return_value = GlobalSettingsDTO(
-            download_directory=str(temp_dir / "downloads"),
-            log_file=str(temp_dir / "test.log"),
-        )
-        return manager
+        return _stub_channel_manager(temp_dir)
 
     @pytest.fixture
     def mock_youtube_client(self) -> MagicMock:
@@ -32,7 +55,7 @@ class TestMultiChannelMonitor:
     @pytest.fixture
     def multi_monitor(
         self,
-        mock_channel_manager: MagicMock,
+        mock_channel_manager: SimpleNamespace,
         mock_youtube_client: MagicMock,
         initialized_logger,
     ) -> MultiChannelMonitor:
@@ -45,7 +68,7 @@ class TestMultiChannelMonitor:
     def test_start_with_no_channels(
         self,
         multi_monitor: MultiChannelMonitor,
-        mock_channel_manager: MagicMock,
+        mock_channel_manager: SimpleNamespace,
     ):
         """Test start() when no enabled channels exist."""
         mock_channel_manager.list_channels.return_value = []
@@ -57,10 +80,9 @@ class TestMultiChannelMonitor:
     def test_start_creates_monitor_threads(
         self,
         multi_monitor: MultiChannelMonitor,
-        mock_channel_manager: MagicMock,
-        temp_dir: Path,
+        mock_channel_manager: SimpleNamespace,
     ):
-        """실제 start() 경로가 채널마다 monitor thread를 생성·등록한다."""
+        """실제 start() 경로가 채널마다 monitor thread를 생성·등록·시작한다."""
         channels = [
             ChannelDTO(
                 id="channel1",
@@ -74,26 +96,25 @@ class TestMultiChannelMonitor:
             ),
         ]
         mock_channel_manager.list_channels.return_value = channels
-        youtube_client = cast(MagicMock, multi_monitor.youtube_client)
-        youtube_client.check_if_live.return_value = (False, None)
 
         def exit_keep_alive_loop(sig, handler):
             # SIGTERM 핸들러 등록 지점에서 메인 while 루프를 즉시 종료시킨다
             multi_monitor.is_running = False
 
-        with patch("src.yt_monitor.monitoring.service.get_notifier"):
+        # 실제 ChannelMonitorThread(디렉토리 생성 + OS 스레드) 대신 채널만 든 mock
+        with patch.object(
+            multi_monitor,
+            "_build_channel_thread",
+            side_effect=lambda channel, _settings: MagicMock(channel=channel),
+        ):
             with patch("src.yt_monitor.monitoring.service.signal") as mock_sig:
                 mock_sig.signal.side_effect = exit_keep_alive_loop
-                with patch("src.yt_monitor.monitoring.service.time") as mock_time:
-                    mock_time.sleep = MagicMock()
-                    multi_monitor.start()
+                multi_monitor.start()
 
-        try:
-            assert len(multi_monitor.monitor_threads) == 2
-            assert "channel1" in multi_monitor.monitor_threads
-            assert "channel2" in multi_monitor.monitor_threads
-        finally:
-            multi_monitor.stop()
+        assert set(multi_monitor.monitor_threads) == {"channel1", "channel2"}
+        for channel_id, monitor_thread in multi_monitor.monitor_threads.items():
+            assert monitor_thread.channel.id == channel_id
+            monitor_thread.start.assert_called_once()
 
     def test_stop_clears_monitor_threads(
         self,
@@ -119,7 +140,7 @@ class TestMultiChannelMonitor:
     def test_add_channel_and_start_monitoring(
         self,
         multi_monitor: MultiChannelMonitor,
-        mock_channel_manager: MagicMock,
+        mock_channel_manager: SimpleNamespace,
         temp_dir: Path,
     ):
         """Test adding a channel and starting monitoring for it."""
@@ -195,7 +216,7 @@ class TestMultiChannelMonitor:
     def test_sync_channel_monitors_starts_new_enabled_channel(
         self,
         multi_monitor: MultiChannelMonitor,
-        mock_channel_manager: MagicMock,
+        mock_channel_manager: SimpleNamespace,
         global_settings: GlobalSettingsDTO,
     ):
         """웹에서 추가된 enabled 채널이 실행 중인 monitor thread로 반영된다."""
@@ -224,7 +245,7 @@ class TestMultiChannelMonitor:
     def test_sync_channel_monitors_stops_disabled_or_removed_channel(
         self,
         multi_monitor: MultiChannelMonitor,
-        mock_channel_manager: MagicMock,
+        mock_channel_manager: SimpleNamespace,
         global_settings: GlobalSettingsDTO,
     ):
         """channels.json에서 빠진 enabled 채널의 기존 thread를 중지한다."""
@@ -249,7 +270,7 @@ class TestMultiChannelMonitor:
     def test_sync_channel_monitors_restarts_updated_channel(
         self,
         multi_monitor: MultiChannelMonitor,
-        mock_channel_manager: MagicMock,
+        mock_channel_manager: SimpleNamespace,
         global_settings: GlobalSettingsDTO,
     ):
         """URL/포맷 등 채널 설정 변경은 기존 thread 재시작으로 반영한다."""
@@ -290,8 +311,6 @@ class TestMultiChannelMonitor:
         multi_monitor: MultiChannelMonitor,
     ):
         """FastAPI thread의 remove는 monitor_threads lock 해제 전 실행되면 안 된다."""
-        import threading
-
         class ObservableLock:
             def __init__(self):
                 self._lock = threading.RLock()
@@ -337,26 +356,17 @@ class TestMultiChannelMonitorBackgroundThread:
     signal.signal() 때문에 죽지 않아야 한다.
     """
 
+    @pytest.mark.slow
     def test_start_in_background_thread_skips_signal_registration(
         self,
         tmp_path: Path,
         initialized_logger,
+        monkeypatch: pytest.MonkeyPatch,
     ):
         """sub-thread에서 start() 호출 시 signal.signal()이 호출되지 않아야 한다."""
         import threading as real_threading
 
-        manager = MagicMock(spec=ChannelManager)
-        manager.list_channels.return_value = [
-            ChannelDTO(
-                id="ch1",
-                name="Test Channel",
-                url="https://www.youtube.com/@TestChannel",
-            )
-        ]
-        manager.get_global_settings.return_value = GlobalSettingsDTO(
-            download_directory=str(tmp_path / "downloads"),
-            log_file=str(tmp_path / "test.log"),
-        )
+        manager = _stub_channel_manager(tmp_path, [_SINGLE_CHANNEL])
 
         mock_youtube_client = MagicMock()
         mock_youtube_client.check_if_live.return_value = (False, None)
@@ -370,17 +380,18 @@ class TestMultiChannelMonitorBackgroundThread:
 
         run_error: dict = {}
 
+        def stop_loop(*_args) -> None:
+            # 첫 sleep에서 즉시 종료 — 핸들러 등록 분기를 통과한 직후 빠진다
+            monitor.is_running = False
+
+        # autouse _no_sleep 위에 덮어쓴다 — 테스트 종료 시 monkeypatch가 함께 되돌린다
+        monkeypatch.setattr(service_module.time, "sleep", stop_loop)
+
         def run_monitor():
             try:
                 with patch("src.yt_monitor.monitoring.service.signal") as mock_sig:
-                    with patch("src.yt_monitor.monitoring.service.time.sleep") as mock_sleep:
-                        # 첫 sleep에서 즉시 종료 — 핸들러 등록 분기를 통과한 직후 빠진다
-                        def stop_loop(*args, **kwargs):
-                            monitor.is_running = False
-
-                        mock_sleep.side_effect = stop_loop
-                        monitor.start()
-                        run_error["signal_called"] = mock_sig.signal.called
+                    monitor.start()
+                    run_error["signal_called"] = mock_sig.signal.called
             except Exception as error:
                 run_error["error"] = error
 
@@ -399,25 +410,13 @@ class TestMultiChannelMonitorSigterm:
     """SIGTERM 수신 시 notify_monitor_stopped가 호출되는지 검증."""
 
     @pytest.fixture
-    def mock_channel_manager(self, tmp_path: Path) -> MagicMock:
-        from src.yt_monitor.channels.repository import ChannelManager
-        manager = MagicMock(spec=ChannelManager)
-        manager.list_channels.return_value = [
-            ChannelDTO(
-                id="ch1",
-                name="Test Channel",
-                url="https://www.youtube.com/@TestChannel",
-            )
-        ]
-        manager.get_global_settings.return_value = GlobalSettingsDTO(
-            download_directory=str(tmp_path / "downloads"),
-            log_file=str(tmp_path / "test.log"),
-        )
-        return manager
+    def mock_channel_manager(self, tmp_path: Path) -> SimpleNamespace:
+        return _stub_channel_manager(tmp_path, [_SINGLE_CHANNEL])
 
+    @pytest.mark.slow
     def test_sigterm_sends_monitor_stopped_notification(
         self,
-        mock_channel_manager: MagicMock,
+        mock_channel_manager: SimpleNamespace,
         initialized_logger,
     ):
         """SIGTERM 수신 시 notify_monitor_stopped(reason='docker stop (SIGTERM)')가 호출된다."""
@@ -443,8 +442,7 @@ class TestMultiChannelMonitorSigterm:
         with patch("src.yt_monitor.monitoring.service.signal") as mock_sig:
             mock_sig.SIGTERM = real_signal.SIGTERM
             mock_sig.signal.side_effect = capture_and_stop
-            with patch("src.yt_monitor.monitoring.service.time.sleep"):
-                monitor.start()
+            monitor.start()
 
         assert real_signal.SIGTERM in captured_handler
 
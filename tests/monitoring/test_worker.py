@@ -1,6 +1,8 @@
 """Per-channel monitoring worker contracts."""
 
+from dataclasses import replace
 from pathlib import Path
+from typing import Generator, Optional
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -10,14 +12,21 @@ from src.yt_monitor.monitoring.worker import ChannelMonitorThread, _sanitize_nam
 from src.yt_monitor.youtube.client import LiveStreamInfo, YouTubeAuthError
 
 
+class _DownloadCrash(Exception):
+    """테스트 전용 예외 — pytest.raises가 엉뚱한 실패(AssertionError 등)를 삼키지 않게 한다."""
+
+
+_INVALID_NAME_CHARS = frozenset('<>:"/\\|?*')
+
+
 class TestSanitizeName:
     """모듈 레벨 _sanitize_name 순수 함수 검증."""
 
     def test_removes_invalid_chars(self):
         sanitized = _sanitize_name('Test<>:"/\\|?*Channel')
 
-        for char in '<>:"/\\|?*':
-            assert char not in sanitized
+        assert not set(sanitized) & _INVALID_NAME_CHARS
+        assert sanitized == "Test" + "_" * len(_INVALID_NAME_CHARS) + "Channel"
 
     def test_preserves_valid_chars(self):
         assert _sanitize_name("Test Channel 123") == "Test Channel 123"
@@ -57,28 +66,43 @@ class TestChannelMonitorThread:
         """Test that __init__ creates channel-specific download directory."""
         ChannelMonitorThread(
             channel=sample_channel,
-            global_settings=global_settings,
+            global_settings=replace(
+                global_settings, download_directory=str(temp_dir / "downloads")
+            ),
             youtube_client=mock_youtube_client,
         )
 
         expected_dir = temp_dir / "downloads" / "live" / "Test Channel"
         assert expected_dir.exists()
 
+    @pytest.fixture
+    def thread_class(self) -> Generator[MagicMock, None, None]:
+        """OS 스레드를 띄우지 않도록 worker의 threading.Thread를 mock으로 바꾼다."""
+        with patch("src.yt_monitor.monitoring.worker.threading.Thread") as thread_class:
+            yield thread_class
+
     def test_start_and_stop_manage_thread_lifecycle(
-        self, monitor_thread: ChannelMonitorThread
+        self, monitor_thread: ChannelMonitorThread, thread_class: MagicMock
     ):
-        """start()는 daemon thread를 시작하고 stop()은 실행 상태를 내린다."""
+        """start()는 daemon thread를 시작하고 stop()은 대기를 깨운 뒤 join한다."""
         monitor_thread.start()
 
         assert monitor_thread.is_running is True
-        assert monitor_thread.thread is not None
-        assert monitor_thread.thread.daemon is True
+        assert monitor_thread.thread is thread_class.return_value
+        assert thread_class.call_args.kwargs == {
+            "target": monitor_thread._monitor_loop,
+            "daemon": True,
+        }
+        thread_class.return_value.start.assert_called_once()
 
         monitor_thread.stop()
+
         assert monitor_thread.is_running is False
+        assert monitor_thread._stop_event.is_set()
+        thread_class.return_value.join.assert_called_once_with(timeout=5.0)
 
     def test_start_does_nothing_if_already_running(
-        self, monitor_thread: ChannelMonitorThread
+        self, monitor_thread: ChannelMonitorThread, thread_class: MagicMock
     ):
         """Test that start() does nothing if already running."""
         monitor_thread.start()
@@ -87,9 +111,19 @@ class TestChannelMonitorThread:
         monitor_thread.start()
 
         assert monitor_thread.thread is first_thread
+        thread_class.assert_called_once()
 
+    def test_restart_clears_stop_event(
+        self, monitor_thread: ChannelMonitorThread, thread_class: MagicMock
+    ):
+        """stop() 후 다시 start()하면 새 루프가 곧바로 빠지지 않도록 Event를 내린다."""
+        monitor_thread.start()
         monitor_thread.stop()
 
+        monitor_thread.start()
+
+        assert not monitor_thread._stop_event.is_set()
+
     def test_stop_terminates_active_downloader(
         self, monitor_thread: ChannelMonitorThread
     ):
@@ -99,53 +133,6 @@ class TestChannelMonitorThread:
 
         mock_stop.assert_called_once()
 
-    def test_monitor_cycle_checks_for_live(
-        self,
-        monitor_thread: ChannelMonitorThread,
-        mock_youtube_client: MagicMock,
-    ):
-        """Test that _monitor_cycle checks for live stream."""
-        mock_youtube_client.check_if_live.return_value = (False, None)
-
-        monitor_thread._monitor_cycle()
-
-        mock_youtube_client.check_if_live.assert_called_once_with(
-            "https://www.youtube.com/@TestChannel"
-        )
-
-    def test_monitor_cycle_skips_when_downloading(
-        self,
-        monitor_thread: ChannelMonitorThread,
-        mock_youtube_client: MagicMock,
-    ):
-        """Test that _monitor_cycle skips check when downloading."""
-        monitor_thread.is_downloading = True
-
-        monitor_thread._monitor_cycle()
-
-        mock_youtube_client.check_if_live.assert_not_called()
-
-    def test_monitor_cycle_handles_live_stream(
-        self,
-        monitor_thread: ChannelMonitorThread,
-        mock_youtube_client: MagicMock,
-    ):
-        """Test that _monitor_cycle calls _handle_live_stream when live."""
-        stream_info = LiveStreamInfo(
-            video_id="abc123",
-            url="https://www.youtube.com/watch?v=abc123",
-            title="Live Stream",
-        )
-        mock_youtube_client.check_if_live.return_value = (True, stream_info)
-
-        with patch.object(monitor_thread, "_handle_live_stream") as mock_handle:
-            monitor_thread._monitor_cycle()
-
-            mock_handle.assert_called_once_with(
-                "https://www.youtube.com/watch?v=abc123",
-                "Live Stream",
-            )
-
     def test_handle_live_stream_resets_flag_when_notifier_raises(
         self,
         sample_channel: ChannelDTO,
@@ -167,7 +154,7 @@ class TestChannelMonitorThread:
             notifier=notifier,
         )
 
-        with pytest.raises(RuntimeError):
+        with pytest.raises(RuntimeError, match="webhook 5xx"):
             thread._handle_live_stream(
                 "https://www.youtube.com/watch?v=test",
                 "Test Stream",
@@ -176,6 +163,91 @@ class TestChannelMonitorThread:
         assert thread.is_downloading is False
 
 
+_LIVE_STREAM = LiveStreamInfo(
+    video_id="abc123",
+    url="https://www.youtube.com/watch?v=abc123",
+    title="Live Stream",
+)
+
+
+@pytest.fixture(scope="class")
+def shared_youtube_client() -> MagicMock:
+    return MagicMock()
+
+
+@pytest.fixture(scope="class")
+def shared_monitor_thread(
+    sample_channel: ChannelDTO,
+    global_settings: GlobalSettingsDTO,
+    shared_youtube_client: MagicMock,
+    class_initialized_logger,
+) -> ChannelMonitorThread:
+    """클래스 전체가 공유하는 worker — 다운로드 디렉토리 생성과 객체 구성을 한 번만 한다."""
+    return ChannelMonitorThread(
+        channel=sample_channel,
+        global_settings=global_settings,
+        youtube_client=shared_youtube_client,
+    )
+
+
+class TestChannelMonitorThreadCycle:
+    """_monitor_cycle 분기 검증 — worker를 클래스 단위로 공유하고 테스트마다 상태만 되돌린다."""
+
+    @pytest.fixture
+    def mock_youtube_client(self, shared_youtube_client: MagicMock) -> MagicMock:
+        shared_youtube_client.reset_mock(return_value=True, side_effect=True)
+        return shared_youtube_client
+
+    @pytest.fixture
+    def monitor_thread(
+        self,
+        shared_monitor_thread: ChannelMonitorThread,
+        mock_youtube_client: MagicMock,
+    ) -> ChannelMonitorThread:
+        shared_monitor_thread.is_downloading = False
+        return shared_monitor_thread
+
+    @pytest.mark.parametrize(
+        ("check_result", "is_downloading", "expected_checks", "expected_handle"),
+        [
+            pytest.param((False, None), False, 1, None, id="no_live"),
+            pytest.param(
+                (True, _LIVE_STREAM),
+                False,
+                1,
+                ("https://www.youtube.com/watch?v=abc123", "Live Stream"),
+                id="live_found",
+            ),
+            pytest.param((False, None), True, 0, None, id="skips_when_downloading"),
+        ],
+    )
+    def test_monitor_cycle(
+        self,
+        monitor_thread: ChannelMonitorThread,
+        mock_youtube_client: MagicMock,
+        check_result: tuple,
+        is_downloading: bool,
+        expected_checks: int,
+        expected_handle: Optional[tuple],
+    ):
+        """_monitor_cycle은 다운로드 중이면 건너뛰고, 라이브면 _handle_live_stream에 넘긴다."""
+        mock_youtube_client.check_if_live.return_value = check_result
+        monitor_thread.is_downloading = is_downloading
+
+        with patch.object(monitor_thread, "_handle_live_stream") as mock_handle:
+            monitor_thread._monitor_cycle()
+
+        assert mock_youtube_client.check_if_live.call_count == expected_checks
+        if expected_checks:
+            mock_youtube_client.check_if_live.assert_called_with(
+                "https://www.youtube.com/@TestChannel"
+            )
+        if expected_handle is None:
+            mock_handle.assert_not_called()
+        else:
+            mock_handle.assert_called_once_with(*expected_handle)
+
+
 class TestChannelMonitorThreadNotifications:
     """알림 호출 검증 — 라이브 감지/다운로드/에러 이벤트가 Discord에 전송되는지.
 
@@ -255,9 +327,9 @@ class TestChannelMonitorThreadNotifications:
         with patch.object(
             monitor_thread.downloader,
             "download",
-            side_effect=Exception("ffmpeg crashed"),
+            side_effect=_DownloadCrash("ffmpeg crashed"),
         ):
-            with pytest.raises(Exception):
+            with pytest.raises(_DownloadCrash):
                 monitor_thread._handle_live_stream(
                     "https://youtube.com/watch?v=abc", "방송 제목"
                 )
@@ -280,9 +352,9 @@ class TestChannelMonitorThreadNotifications:
         with patch.object(
             monitor_thread, "_monitor_cycle", side_effect=cycle_side_effect
         ):
-            with patch("src.yt_monitor.monitoring.worker.time.sleep"):
-                monitor_thread.is_running = True
-                monitor_thread._monitor_loop()
+            monitor_thread.is_running = True
+            monitor_thread._stop_event.set()  # 사이클 사이 대기 없이 바로 다음 반복
+            monitor_thread._monitor_loop()
 
         mock_notifier.notify_error.assert_called_once_with(
             channel_name="Test Channel",
@@ -321,9 +393,9 @@ class TestChannelMonitorThreadNotifications:
             raise YouTubeAuthError("Sign in to confirm you're not a bot")
 
         with patch.object(thread, "_monitor_cycle", side_effect=cycle_side_effect):
-            with patch("src.yt_monitor.monitoring.worker.time.sleep"):
-                thread.is_running = True
-                thread._monitor_loop()
+            thread.is_running = True
+            thread._stop_event.set()  # 사이클 사이 대기 없이 바로 다음 반복
+            thread._monitor_loop()
 
         mock_notifier.notify_bot_detection.assert_called_once_with(
             channel_name="Test Channel",
@@ -363,8 +435,8 @@ class TestChannelMonitorThreadNotifications:
             raise YouTubeAuthError("Sign in to confirm you're not a bot")
 
         with patch.object(thread, "_monitor_cycle", side_effect=cycle_side_effect):
-            with patch("src.yt_monitor.monitoring.worker.time.sleep"):
-                thread.is_running = True
-                thread._monitor_loop()
+            thread.is_running = True
+            thread._stop_event.set()  # 사이클 사이 대기 없이 바로 다음 반복
+            thread._monitor_loop()
 
         assert mock_notifier.notify_bot_detection.call_count == 2
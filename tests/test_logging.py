@@ -4,22 +4,49 @@ import logging
 import os
 from datetime import datetime, timedelta
 from pathlib import Path
+from typing import Generator
 
 import pytest
 
+from src.yt_monitor import logging as logging_module
 from src.yt_monitor.logging import Logger
 
 
+def _file_handler(logger: logging.Logger) -> logging.FileHandler:
+    """로그 파일을 쓰는 handler — read_text 전에 이것만 flush하면 된다."""
+    return next(h for h in logger.handlers if isinstance(h, logging.FileHandler))
+
+
+@pytest.fixture(scope="class")
+def release_logger_after_class() -> Generator[None, None, None]:
+    """클래스가 끝날 때 한 번만 handler를 닫아 다른 모듈에 상태를 넘기지 않는다."""
+    yield
+    Logger.reset()
+
+
+@pytest.mark.xdist_group(name="logger")
+@pytest.mark.usefixtures("release_logger_after_class")
 class TestLogger:
-    """Test cases for Logger class."""
+    """Test cases for Logger class.
 
-    def setup_method(self):
-        """Reset logger state before each test."""
-        Logger.reset()
+    Logger 싱글톤을 reset/initialize하므로 병렬 실행 시 한 worker에 모은다.
+    """
+
+    @pytest.fixture(autouse=True)
+    def _fresh_logger(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """각 테스트는 자기 temp 로그 파일로 initialize하므로 시작 전에만 reset한다.
 
-    def teardown_method(self):
-        """Clean up logger state after each test."""
+        직전 테스트의 teardown reset과 다음 테스트의 setup reset이 겹치던 것을
+        하나로 줄였다 — 마지막 정리는 클래스 scope fixture가 맡는다.
+        파일 기록은 모듈 하단의 단일 테스트만 검증하므로 여기서는 FileHandler 대신
+        NullHandler를 끼워 테스트마다 파일을 열고 닫지 않는다.
+        """
         Logger.reset()
+        monkeypatch.setattr(
+            logging_module,
+            "TimedRotatingFileHandler",
+            lambda *_args, **_kwargs: logging.NullHandler(),
+        )
 
     def test_initialize_creates_parent_directories(self, temp_dir: Path):
         """Test that initialize creates parent directories if needed."""
@@ -42,29 +69,17 @@ class TestLogger:
         with pytest.raises(RuntimeError, match="Logger not initialized"):
             Logger.get()
 
-    def test_logger_writes_to_file(self, temp_log_file: Path):
-        """Test that logger writes messages to the log file."""
+    def test_logger_emits_messages(
+        self, temp_log_file: Path, caplog: pytest.LogCaptureFixture
+    ):
+        """Test that logger emits messages (captured in memory via caplog)."""
         logger = Logger.initialize(str(temp_log_file))
         test_message = "Test log message"
 
-        logger.info(test_message)
-
-        for handler in logger.handlers:
-            handler.flush()
-
-        log_content = temp_log_file.read_text()
-        assert test_message in log_content
-
-    def test_logger_has_correct_format(self, temp_log_file: Path):
-        """Test that log messages have the expected format."""
-        logger = Logger.initialize(str(temp_log_file))
-        logger.info("Format test")
-
-        for handler in logger.handlers:
-            handler.flush()
+        with caplog.at_level(logging.INFO, logger=logger.name):
+            logger.info(test_message)
 
-        log_content = temp_log_file.read_text()
-        assert " - INFO - " in log_content
+        assert test_message in caplog.text
 
     def test_logger_default_level_is_info(self, temp_log_file: Path):
         """Test that the default log level is INFO."""
@@ -72,14 +87,26 @@ class TestLogger:
 
         assert logger.level == logging.INFO
 
-    def test_cleanup_old_logs(self, temp_dir: Path):
+    def test_cleanup_old_logs(
+        self, temp_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ):
         """Test that old log files are cleaned up."""
         log_file = temp_dir / "test.log"
 
         old_log_file = temp_dir / "test.log.2020-01-01"
-        old_log_file.write_text("old log content")
+        old_log_file.touch()
         old_time = (datetime.now() - timedelta(days=10)).timestamp()
-        os.utime(old_log_file, (old_time, old_time))
+
+        # utime으로 파일 시각을 바꾸는 대신 _cleanup_old_logs가 보는 stat()만 속인다
+        real_stat = Path.stat
+
+        def fake_stat(path: Path, *args, **kwargs) -> os.stat_result:
+            result = real_stat(path, *args, **kwargs)
+            if path == old_log_file:
+                return os.stat_result((*result[:7], old_time, old_time, result[9]))
+            return result
+
+        monkeypatch.setattr(Path, "stat", fake_stat)
 
         Logger.initialize(str(log_file), retention_days=7)
 
@@ -103,3 +130,20 @@ class TestLogger:
 
         with pytest.raises(RuntimeError, match="Logger not initialized"):
             Logger.get()
+
+
+@pytest.mark.xdist_group(name="logger")
+def test_logger_writes_formatted_lines_to_file(temp_log_file: Path):
+    """실제 TimedRotatingFileHandler로 파일에 기대한 형식이 기록된다."""
+    Logger.reset()
+    try:
+        logger = Logger.initialize(str(temp_log_file))
+        logger.info("Format test")
+
+        _file_handler(logger).flush()
+
+        log_content = temp_log_file.read_text(encoding="utf-8")
+        assert "Format test" in log_content
+        assert " - INFO - " in log_content
+    finally:
+        Logger.reset()
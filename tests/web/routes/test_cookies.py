@@ -4,6 +4,7 @@ CookieValidator 자체의 단위 테스트는 test_cookie_validator.py.
 알림 책임은 validator에서 분리되어 호출자(web_api)로 이동했다.
 """
 
+from contextlib import ExitStack
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -11,6 +12,7 @@ from fastapi.testclient import TestClient
 
 from src.yt_monitor.youtube.cookie_validation import CookieValidator, invalidate_cookie_cache
 from src.yt_monitor.web.app import WebAPI
+from tests.fakes import FakeYDL
 
 
 @pytest.fixture(autouse=True)
@@ -21,26 +23,30 @@ def reset_default_validator_cache():
 
 
 @pytest.fixture
-def client_and_notifier(channels_file: str):
+def client_and_notifier(channels_file: str, mock_ydl: FakeYDL):
     """TestClient + mock notifier + yt-dlp가 인증 실패하는 validator 세팅."""
     mock_notifier = MagicMock()
     fresh_validator = CookieValidator()
 
-    mock_ydl = MagicMock()
-    mock_ydl.__enter__ = lambda s: mock_ydl
-    mock_ydl.__exit__ = MagicMock(return_value=False)
     mock_ydl.extract_info.side_effect = Exception(
         "Sign in to confirm you're not a bot"
     )
 
-    with patch("src.yt_monitor.youtube.cookie_validation._default_validator", fresh_validator):
-        with patch(
-            "src.yt_monitor.web.routes.cookies.get_notifier",
-            return_value=mock_notifier,
-        ):
-            with patch("yt_dlp.YoutubeDL", return_value=mock_ydl):
-                web_api = WebAPI(channels_file=channels_file)
-                yield TestClient(web_api.app), mock_notifier
+    with ExitStack() as stack:
+        stack.enter_context(
+            patch(
+                "src.yt_monitor.youtube.cookie_validation._default_validator",
+                fresh_validator,
+            )
+        )
+        stack.enter_context(
+            patch(
+                "src.yt_monitor.web.routes.cookies.get_notifier",
+                return_value=mock_notifier,
+            )
+        )
+        web_api = WebAPI(channels_file=channels_file)
+        yield TestClient(web_api.app), mock_notifier
 
 
 class TestCookieStatusEndpointNotifications:
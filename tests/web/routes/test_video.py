@@ -2,12 +2,14 @@
 
 import asyncio
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
 
 from src.yt_monitor.channels.repository import ChannelManager
+from src.yt_monitor.web.routes.video import _store_video_info
 
 
 class TestVideoDownloadRoutes:
@@ -41,9 +43,82 @@ class TestVideoDownloadRoutes:
             "thumbnail": "https://example.com/thumb.jpg",
         }
         downloader_class.return_value.get_video_info.assert_called_once_with(
-            "https://www.youtube.com/watch?v=abc"
+            "https://www.youtube.com/watch?v=abc", fast=True
         )
 
+    def test_video_info_reuses_cached_lookup_for_same_clean_url(
+        self, client: TestClient
+    ):
+        with patch(
+            "src.yt_monitor.web.routes.video.VideoDownloader"
+        ) as downloader_class:
+            downloader_class.return_value.get_video_info.return_value = {
+                "title": "Video",
+                "is_live": False,
+            }
+            first = client.post(
+                "/api/video/info",
+                json={"url": "https://www.youtube.com/watch?v=abc&list=PL1"},
+            )
+            second = client.post(
+                "/api/video/info",
+                json={"url": "https://www.youtube.com/watch?v=abc"},
+            )
+
+        assert first.json() == second.json()
+        downloader_class.return_value.get_video_info.assert_called_once()
+
+    def test_video_info_refresh_keeps_other_entries(self, client: TestClient):
+        """만료된 키를 갱신할 때 가득 찬 캐시에서 다른 항목을 밀어내지 않는다."""
+        clock = SimpleNamespace(now=0.0)
+        fake_time = SimpleNamespace(monotonic=lambda: clock.now)
+
+        with (
+            patch("src.yt_monitor.web.routes.video.time", fake_time),
+            patch("src.yt_monitor.web.routes.video.VIDEO_INFO_CACHE_MAX_ENTRIES", 3),
+            patch(
+                "src.yt_monitor.web.routes.video.VideoDownloader"
+            ) as downloader_class,
+        ):
+            get_video_info = downloader_class.return_value.get_video_info
+            get_video_info.return_value = {"title": "Video", "is_live": False}
+
+            def lookup(video_id: str) -> None:
+                client.post(
+                    "/api/video/info",
+                    json={"url": f"https://www.youtube.com/watch?v={video_id}"},
+                )
+
+            lookup("a")
+            clock.now = 30.0
+            lookup("b")
+            clock.now = 70.0  # a 만료 → 갱신하면 맨 뒤로 간다
+            lookup("a")
+            clock.now = 75.0
+            lookup("c")
+            clock.now = 95.0  # b 만료 → 가득 찬 캐시에서 갱신해도 a/c는 남는다
+            lookup("b")
+            lookup("a")
+            lookup("c")
+
+        assert get_video_info.call_count == 5
+
+    def test_video_info_does_not_cache_live_streams(self, client: TestClient):
+        with patch(
+            "src.yt_monitor.web.routes.video.VideoDownloader"
+        ) as downloader_class:
+            downloader_class.return_value.get_video_info.return_value = {
+                "title": "Live",
+                "is_live": True,
+            }
+            for _ in range(2):
+                client.post(
+                    "/api/video/info",
+                    json={"url": "https://www.youtube.com/watch?v=live"},
+                )
+
+        assert downloader_class.return_value.get_video_info.call_count == 2
+
     def test_video_info_timeout_returns_408(self, client: TestClient):
         with patch(
             "src.yt_monitor.web.routes.video.asyncio.to_thread",
@@ -165,3 +240,27 @@ class TestVideoDownloadRoutes:
         response = client.get("/api/download/file/..%5Csecret.txt")
 
         assert response.status_code == 404
+
+
+def test_store_video_info_purges_expired_entries_first() -> None:
+    """새 키를 넣을 때 만료 항목을 앞에서부터 지우고, 유효한 항목은 남긴다."""
+    cache = {
+        "expired-1": (10.0, {}),
+        "expired-2": (20.0, {}),
+        "fresh": (90.0, {}),
+    }
+
+    _store_video_info(cache, "new", {}, now=50.0)
+
+    assert list(cache) == ["fresh", "new"]
+
+
+def test_store_video_info_moves_existing_key_without_evicting() -> None:
+    """이미 있는 키를 다시 넣으면 다른 항목은 그대로 두고 맨 뒤로 옮긴다."""
+    cache = {"a": (10.0, {}), "b": (90.0, {})}
+
+    with patch("src.yt_monitor.web.routes.video.VIDEO_INFO_CACHE_MAX_ENTRIES", 2):
+        _store_video_info(cache, "a", {"title": "new"}, now=50.0)
+
+    assert list(cache) == ["b", "a"]
+    assert cache["a"] == (110.0, {"title": "new"})
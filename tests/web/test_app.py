@@ -1,11 +1,16 @@
 """Tests for web_api module — /health 엔드포인트 검증."""
 
+import asyncio
+import threading
 import tomllib
 from pathlib import Path
+from unittest.mock import patch
 
+import pytest
 from fastapi.testclient import TestClient
 
 from src.yt_monitor.web.app import WebAPI
+from src.yt_monitor.web.middleware import _is_file_download
 
 
 class TestHealthEndpoint:
@@ -26,6 +31,121 @@ class TestHealthEndpoint:
         assert "application/json" in response.headers["content-type"]
 
 
+class TestThreadPool:
+    """lifespan이 blocking 작업용 기본 executor를 교체하는지 검증."""
+
+    def test_to_thread_runs_on_sized_app_pool(self, channels_file: str, monkeypatch):
+        monkeypatch.setenv("YT_WEB_THREAD_POOL_SIZE", "3")
+        web_api = WebAPI(channels_file=channels_file)
+
+        @web_api.app.get("/_thread_name")
+        async def thread_name():
+            return {
+                "name": await asyncio.to_thread(
+                    lambda: threading.current_thread().name
+                )
+            }
+
+        with TestClient(web_api.app) as client:
+            name = client.get("/_thread_name").json()["name"]
+
+        assert web_api.thread_pool_size == 3
+        assert name.startswith("ytw")
+
+    def test_lifespan_preloads_youtube_extractor(self, channels_file: str):
+        """startup 때 app pool에서 YouTube 추출기 모듈을 미리 불러온다."""
+        web_api = WebAPI(channels_file=channels_file)
+        preloaded = threading.Event()
+
+        with patch(
+            "src.yt_monitor.web.app._preload_youtube_extractor",
+            side_effect=preloaded.set,
+        ):
+            with TestClient(web_api.app):
+                assert preloaded.wait(timeout=5)
+
+    def test_lifespan_logs_preload_failure(self, channels_file: str):
+        """추출기 preload가 실패하면 app logger로 경고를 남긴다."""
+        web_api = WebAPI(channels_file=channels_file)
+        warned = threading.Event()
+
+        with (
+            patch(
+                "src.yt_monitor.web.app._preload_youtube_extractor",
+                side_effect=ImportError("no youtube extractor"),
+            ),
+            patch.object(
+                web_api.logger, "warning", side_effect=lambda *_: warned.set()
+            ) as warning,
+        ):
+            with TestClient(web_api.app):
+                assert warned.wait(timeout=5)
+
+        assert "no youtube extractor" in warning.call_args[0][0]
+
+    def test_invalid_pool_size_falls_back_to_default(
+        self, channels_file: str, monkeypatch
+    ):
+        monkeypatch.setenv("YT_WEB_THREAD_POOL_SIZE", "many")
+
+        web_api = WebAPI(channels_file=channels_file)
+
+        assert web_api.thread_pool_size == 64
+
+
+class TestResponseCompression:
+    """큰 API 응답은 gzip, 파일 다운로드는 원본 그대로."""
+
+    def test_large_channel_list_is_gzipped(self, client: TestClient):
+        for index in range(30):
+            client.post(
+                "/api/channels",
+                json={
+                    "name": f"Channel {index}",
+                    "url": f"https://www.youtube.com/@Channel{index}",
+                },
+            )
+
+        response = client.get("/api/channels", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert len(response.json()) == 30
+
+    def test_file_download_is_not_compressed(
+        self, client: TestClient, channels_file: str
+    ):
+        from src.yt_monitor.channels.repository import ChannelManager
+
+        settings = ChannelManager(channels_file).get_global_settings()
+        web_downloads = Path(settings.download_directory) / "web_downloads"
+        web_downloads.mkdir(parents=True)
+        (web_downloads / "big.mp4").write_bytes(b"0" * 4096)
+
+        response = client.get(
+            "/api/download/file/big.mp4", headers={"Accept-Encoding": "gzip"}
+        )
+
+        assert "content-encoding" not in response.headers
+        assert response.headers["content-length"] == "4096"
+
+    @pytest.mark.parametrize(
+        ("path", "expected"),
+        [
+            ("/api/download/file/big.mp4", True),
+            ("/api/merge/jobs/abc123/download", True),
+            ("/api/split/jobs/abc123/download/2", True),
+            ("/api/download", False),
+            ("/api/downloads/status", False),
+            ("/api/merge/jobs/abc123", False),
+            ("/api/channels/download-settings", False),
+        ],
+    )
+    def test_is_file_download_matches_only_file_routes(
+        self, path: str, expected: bool
+    ):
+        assert _is_file_download(path) is expected
+
+
 class TestWebAssets:
     """루트 HTML과 분리된 정적 자산 서빙 검증."""
 
@@ -35,6 +155,17 @@ class TestWebAssets:
         assert 'href="/static/app.css"' in response.text
         assert 'src="/static/app.js"' in response.text
 
+    def test_root_reads_index_html_once_while_unchanged(self, client: TestClient):
+        original_read_bytes = Path.read_bytes
+        with patch.object(
+            Path, "read_bytes", autospec=True, side_effect=original_read_bytes
+        ) as read_bytes:
+            first = client.get("/")
+            second = client.get("/")
+
+        assert first.text == second.text
+        assert read_bytes.call_count == 1
+
     def test_static_assets_are_served(self, client: TestClient):
         css = client.get("/static/app.css")
         js = client.get("/static/app.js")
@@ -7,12 +7,14 @@ import pytest
 from src.yt_monitor.web import entrypoint
 
 
-def test_main_starts_web_api_from_environment_port(monkeypatch) -> None:
+def test_main_starts_web_api_from_environment_port(monkeypatch, capsys) -> None:
     monkeypatch.setenv("YT_WEB_PORT", "9123")
 
     with patch.object(entrypoint, "WebAPI") as web_api_class:
         entrypoint.main()
 
+    assert "http://localhost:9123" in capsys.readouterr().out
+
     web_api_class.assert_called_once_with(channels_file="channels.json")
     web_api_class.return_value.run.assert_called_once_with(
         host="0.0.0.0",
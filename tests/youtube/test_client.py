@@ -1,6 +1,7 @@
 """Tests for youtube_client module."""
 
-from unittest.mock import MagicMock, patch
+from typing import Callable, Optional
+from unittest.mock import patch
 
 import pytest
 
@@ -10,6 +11,42 @@ from src.yt_monitor.youtube.client import (
     YouTubeClient,
     _is_auth_error,
 )
+from tests.fakes import FakeYDL
+
+
+_LIVE_INFO = LiveStreamInfo(
+    video_id="abc123",
+    url="https://www.youtube.com/watch?v=abc123",
+    title="Live Stream",
+)
+
+
+def _detection_stub(name: str, outcome) -> Callable[[str], Optional[LiveStreamInfo]]:
+    """탐지 메서드 stub — outcome이 예외면 던지고, 아니면 그대로 반환하는 plain 함수."""
+
+    def stub(_channel_url: str) -> Optional[LiveStreamInfo]:
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    stub.__name__ = name
+    return stub
+
+
+def _patch_detection(client: YouTubeClient, streams_tab, channel_page, live_endpoint):
+    """세 탐지 메서드를 한 번의 patch.multiple로 바꾼다 (/streams, 채널 페이지, /live 순)."""
+    return patch.multiple(
+        client,
+        _check_streams_tab=_detection_stub("_check_streams_tab", streams_tab),
+        _check_channel_page=_detection_stub("_check_channel_page", channel_page),
+        _check_live_endpoint=_detection_stub("_check_live_endpoint", live_endpoint),
+    )
+
+
+@pytest.fixture(scope="class")
+def youtube_client(class_initialized_logger) -> YouTubeClient:
+    """클래스 단위로 공유하는 client — 상태가 없고 테스트는 patch로만 바꾼다."""
+    return YouTubeClient()
 
 
 class TestLiveStreamInfo:
@@ -34,196 +71,145 @@ class TestLiveStreamInfo:
 
         assert info.url == full_url
 
+
 class TestYouTubeClient:
     """Test cases for YouTubeClient class."""
 
-    @pytest.fixture
-    def youtube_client(self, initialized_logger) -> YouTubeClient:
-        """Create YouTubeClient instance with initialized logger."""
-        return YouTubeClient()
-
-    def test_check_if_live_no_stream(self, youtube_client: YouTubeClient):
-        """Test check_if_live when no stream is found."""
-        with patch.object(youtube_client, "_check_streams_tab", return_value=None):
-            with patch.object(
-                youtube_client, "_check_channel_page", return_value=None
-            ):
-                with patch.object(
-                    youtube_client, "_check_live_endpoint", return_value=None
-                ):
-                    is_live, stream_info = youtube_client.check_if_live(
-                        "https://www.youtube.com/@TestChannel"
-                    )
-
-                assert is_live is False
-                assert stream_info is None
-
-    def test_check_if_live_found_via_streams_tab(self, youtube_client: YouTubeClient):
-        """Test check_if_live when stream found via /streams tab (first method)."""
-        mock_info = LiveStreamInfo(
-            video_id="abc123",
-            url="https://www.youtube.com/watch?v=abc123",
-            title="Live Stream",
-        )
-
-        with patch.object(
-            youtube_client, "_check_streams_tab", return_value=mock_info
-        ):
+    @pytest.mark.parametrize(
+        ("streams_tab", "channel_page", "live_endpoint", "expected"),
+        [
+            (None, None, None, None),
+            (_LIVE_INFO, None, None, _LIVE_INFO),
+            (None, _LIVE_INFO, None, _LIVE_INFO),
+            (None, None, _LIVE_INFO, _LIVE_INFO),
+            (Exception("Network timeout"), None, _LIVE_INFO, _LIVE_INFO),
+        ],
+        ids=[
+            "no_stream",
+            "via_streams_tab",
+            "via_channel_page",
+            "via_live_endpoint",
+            "after_non_auth_error",
+        ],
+    )
+    def test_check_if_live_detection_order(
+        self,
+        youtube_client: YouTubeClient,
+        streams_tab,
+        channel_page,
+        live_endpoint,
+        expected,
+    ):
+        """/streams → 채널 페이지 → /live 순서로 확인하고 처음 찾은 라이브를 반환한다."""
+        with _patch_detection(youtube_client, streams_tab, channel_page, live_endpoint):
             is_live, stream_info = youtube_client.check_if_live(
                 "https://www.youtube.com/@TestChannel"
             )
 
-            assert is_live is True
-            assert stream_info == mock_info
-
-    def test_check_if_live_found_via_channel_page(self, youtube_client: YouTubeClient):
-        """Test check_if_live when stream found via channel page (fallback)."""
-        mock_info = LiveStreamInfo(
-            video_id="abc123",
-            url="https://www.youtube.com/watch?v=abc123",
-            title="Live Stream",
-        )
-
-        with patch.object(youtube_client, "_check_streams_tab", return_value=None):
-            with patch.object(
-                youtube_client, "_check_channel_page", return_value=mock_info
-            ):
-                is_live, stream_info = youtube_client.check_if_live(
-                    "https://www.youtube.com/@TestChannel"
-                )
-
-                assert is_live is True
-                assert stream_info == mock_info
-
-    def test_check_if_live_found_via_live_endpoint(self, youtube_client: YouTubeClient):
-        """/streams와 채널 페이지가 놓친 라이브를 /live fallback에서 잡는다."""
-        mock_info = LiveStreamInfo(
-            video_id="live123",
-            url="https://www.youtube.com/watch?v=live123",
-            title="Live Stream",
-        )
-
-        with patch.object(youtube_client, "_check_streams_tab", return_value=None):
-            with patch.object(
-                youtube_client, "_check_channel_page", return_value=None
-            ):
-                with patch.object(
-                    youtube_client, "_check_live_endpoint", return_value=mock_info
-                ):
-                    is_live, stream_info = youtube_client.check_if_live(
-                        "https://www.youtube.com/@TestChannel"
-                    )
-
-        assert is_live is True
-        assert stream_info == mock_info
+        assert is_live is (expected is not None)
+        assert stream_info == expected
 
     def test_check_streams_tab_returns_none_when_not_live(
-        self, youtube_client: YouTubeClient
+        self, youtube_client: YouTubeClient, mock_ydl: FakeYDL
     ):
         """Test that _check_streams_tab returns None when no live stream."""
-        with patch("yt_dlp.YoutubeDL") as mock_ydl:
-            mock_instance = MagicMock()
-            mock_instance.__enter__ = MagicMock(return_value=mock_instance)
-            mock_instance.__exit__ = MagicMock(return_value=False)
-            mock_instance.extract_info.return_value = {
-                "entries": [
-                    {"id": "video1", "is_live": False},
-                    {"id": "video2", "is_live": False},
-                ]
-            }
-            mock_ydl.return_value = mock_instance
-
-            result = youtube_client._check_streams_tab(
-                "https://www.youtube.com/@TestChannel"
-            )
+        mock_ydl.extract_info.return_value = {
+            "entries": [
+                {"id": "video1", "is_live": False},
+                {"id": "video2", "is_live": False},
+            ]
+        }
+
+        result = youtube_client._check_streams_tab(
+            "https://www.youtube.com/@TestChannel"
+        )
 
-            assert result is None
+        assert result is None
 
     def test_check_streams_tab_returns_info_when_live(
-        self, youtube_client: YouTubeClient
+        self, youtube_client: YouTubeClient, mock_ydl: FakeYDL
     ):
         """Test that _check_streams_tab returns LiveStreamInfo when live."""
-        with patch("yt_dlp.YoutubeDL") as mock_ydl:
-            mock_instance = MagicMock()
-            mock_instance.__enter__ = MagicMock(return_value=mock_instance)
-            mock_instance.__exit__ = MagicMock(return_value=False)
-            mock_instance.extract_info.return_value = {
-                "entries": [
-                    {"id": "video1", "live_status": "was_live"},
-                    {
-                        "id": "live123",
-                        "is_live": None,
-                        "live_status": "is_live",
-                        "title": "Live Now",
-                    },
-                ]
-            }
-            mock_ydl.return_value = mock_instance
-
-            result = youtube_client._check_streams_tab(
-                "https://www.youtube.com/@TestChannel"
-            )
+        mock_ydl.extract_info.return_value = {
+            "entries": [
+                {"id": "video1", "live_status": "was_live"},
+                {
+                    "id": "live123",
+                    "is_live": None,
+                    "live_status": "is_live",
+                    "title": "Live Now",
+                },
+            ]
+        }
+
+        result = youtube_client._check_streams_tab(
+            "https://www.youtube.com/@TestChannel"
+        )
+
+        assert result is not None
+        assert result.video_id == "live123"
+        assert result.title == "Live Now"
 
-            assert result is not None
-            assert result.video_id == "live123"
-            assert result.title == "Live Now"
+    def test_check_streams_tab_skips_invalid_entries(
+        self, youtube_client: YouTubeClient, mock_ydl: FakeYDL
+    ):
+        """None이거나 id 없는 entry는 건너뛰고 다음 라이브 entry를 찾는다."""
+        mock_ydl.extract_info.return_value = {
+            "entries": [
+                None,
+                {"is_live": True, "title": "No ID"},
+                {"id": "live123", "is_live": True, "title": "Live Now"},
+            ]
+        }
+
+        result = youtube_client._check_streams_tab(
+            "https://www.youtube.com/@TestChannel"
+        )
+
+        assert result is not None
+        assert result.video_id == "live123"
 
     def test_check_streams_tab_constructs_correct_url(
-        self, youtube_client: YouTubeClient
+        self, youtube_client: YouTubeClient, mock_ydl: FakeYDL
     ):
         """Test that _check_streams_tab targets the /streams tab."""
-        with patch("yt_dlp.YoutubeDL") as mock_ydl:
-            mock_instance = MagicMock()
-            mock_instance.__enter__ = MagicMock(return_value=mock_instance)
-            mock_instance.__exit__ = MagicMock(return_value=False)
-            mock_instance.extract_info.return_value = {"entries": []}
-            mock_ydl.return_value = mock_instance
-
-            youtube_client._check_streams_tab(
-                "https://www.youtube.com/@TestChannel/"
-            )
+        mock_ydl.extract_info.return_value = {"entries": []}
 
-            mock_instance.extract_info.assert_called_once_with(
-                "https://www.youtube.com/@TestChannel/streams", download=False
-            )
+        youtube_client._check_streams_tab(
+            "https://www.youtube.com/@TestChannel/"
+        )
+
+        mock_ydl.extract_info.assert_called_once_with(
+            "https://www.youtube.com/@TestChannel/streams", download=False
+        )
 
     def test_check_channel_page_constructs_correct_url(
-        self, youtube_client: YouTubeClient
+        self, youtube_client: YouTubeClient, mock_ydl: FakeYDL
     ):
         """Test that _check_channel_page targets the channel root URL."""
-        with patch("yt_dlp.YoutubeDL") as mock_ydl:
-            mock_instance = MagicMock()
-            mock_instance.__enter__ = MagicMock(return_value=mock_instance)
-            mock_instance.__exit__ = MagicMock(return_value=False)
-            mock_instance.extract_info.return_value = {"entries": []}
-            mock_ydl.return_value = mock_instance
-
-            youtube_client._check_channel_page(
-                "https://www.youtube.com/@TestChannel/"
-            )
+        mock_ydl.extract_info.return_value = {"entries": []}
 
-            mock_instance.extract_info.assert_called_once_with(
-                "https://www.youtube.com/@TestChannel", download=False
-            )
+        youtube_client._check_channel_page(
+            "https://www.youtube.com/@TestChannel/"
+        )
+
+        mock_ydl.extract_info.assert_called_once_with(
+            "https://www.youtube.com/@TestChannel", download=False
+        )
 
     def test_check_live_endpoint_constructs_correct_url(
-        self, youtube_client: YouTubeClient
+        self, youtube_client: YouTubeClient, mock_ydl: FakeYDL
     ):
         """Test that _check_live_endpoint targets the /live URL."""
-        with patch("yt_dlp.YoutubeDL") as mock_ydl:
-            mock_instance = MagicMock()
-            mock_instance.__enter__ = MagicMock(return_value=mock_instance)
-            mock_instance.__exit__ = MagicMock(return_value=False)
-            mock_instance.extract_info.return_value = {"entries": []}
-            mock_ydl.return_value = mock_instance
-
-            youtube_client._check_live_endpoint(
-                "https://www.youtube.com/@TestChannel/"
-            )
+        mock_ydl.extract_info.return_value = {"entries": []}
 
-            mock_instance.extract_info.assert_called_once_with(
-                "https://www.youtube.com/@TestChannel/live", download=False
-            )
+        youtube_client._check_live_endpoint(
+            "https://www.youtube.com/@TestChannel/"
+        )
+
+        mock_ydl.extract_info.assert_called_once_with(
+            "https://www.youtube.com/@TestChannel/live", download=False
+        )
 
     def test_parse_info_detects_live_root_metadata(
         self, youtube_client: YouTubeClient
@@ -277,30 +263,15 @@ class TestAuthErrorDetection:
 class TestCheckIfLiveAuthError:
     """check_if_live이 봇 감지 에러를 YouTubeAuthError로 승격하는지 검증."""
 
-    @pytest.fixture
-    def youtube_client(self, initialized_logger) -> YouTubeClient:
-        return YouTubeClient()
-
     def test_raises_auth_error_when_all_methods_hit_bot_detection(
         self, youtube_client: YouTubeClient
     ):
         """모든 탐지 방식이 봇 감지에 걸리면 YouTubeAuthError를 던진다."""
         bot_error = Exception("Sign in to confirm you're not a bot")
 
-        m1 = MagicMock(side_effect=bot_error)
-        m1.__name__ = "_check_streams_tab"
-        m2 = MagicMock(side_effect=bot_error)
-        m2.__name__ = "_check_channel_page"
-        m3 = MagicMock(side_effect=bot_error)
-        m3.__name__ = "_check_live_endpoint"
-
-        with patch.object(youtube_client, "_check_streams_tab", m1):
-            with patch.object(youtube_client, "_check_channel_page", m2):
-                with patch.object(youtube_client, "_check_live_endpoint", m3):
-                    with pytest.raises(YouTubeAuthError) as exc_info:
-                        youtube_client.check_if_live(
-                            "https://www.youtube.com/@TestChannel"
-                        )
+        with _patch_detection(youtube_client, bot_error, bot_error, bot_error):
+            with pytest.raises(YouTubeAuthError) as exc_info:
+                youtube_client.check_if_live("https://www.youtube.com/@TestChannel")
 
         assert "3/3" in str(exc_info.value)
         assert "Sign in to confirm" in str(exc_info.value)
@@ -311,20 +282,9 @@ class TestCheckIfLiveAuthError:
         """일부 방식만 봇 감지에 걸려도 라이브를 놓칠 수 있으므로 예외 승격."""
         bot_error = Exception("Sign in to confirm you're not a bot")
 
-        m1 = MagicMock(side_effect=bot_error)
-        m1.__name__ = "_check_streams_tab"
-
-        with patch.object(youtube_client, "_check_streams_tab", m1):
-            with patch.object(
-                youtube_client, "_check_channel_page", return_value=None
-            ):
-                with patch.object(
-                    youtube_client, "_check_live_endpoint", return_value=None
-                ):
-                    with pytest.raises(YouTubeAuthError) as exc_info:
-                        youtube_client.check_if_live(
-                            "https://www.youtube.com/@TestChannel"
-                        )
+        with _patch_detection(youtube_client, bot_error, None, None):
+            with pytest.raises(YouTubeAuthError) as exc_info:
+                youtube_client.check_if_live("https://www.youtube.com/@TestChannel")
 
         assert "1/3" in str(exc_info.value)
 
@@ -332,19 +292,12 @@ class TestCheckIfLiveAuthError:
         self, youtube_client: YouTubeClient
     ):
         """봇 감지가 아닌 일반 에러는 기존처럼 (False, None) 반환."""
-        m1 = MagicMock(side_effect=Exception("Network timeout"))
-        m1.__name__ = "_check_streams_tab"
-
-        with patch.object(youtube_client, "_check_streams_tab", m1):
-            with patch.object(
-                youtube_client, "_check_channel_page", return_value=None
-            ):
-                with patch.object(
-                    youtube_client, "_check_live_endpoint", return_value=None
-                ):
-                    is_live, stream_info = youtube_client.check_if_live(
-                        "https://www.youtube.com/@TestChannel"
-                    )
+        network_error = Exception("Network timeout")
+
+        with _patch_detection(youtube_client, network_error, None, None):
+            is_live, stream_info = youtube_client.check_if_live(
+                "https://www.youtube.com/@TestChannel"
+            )
 
         assert is_live is False
         assert stream_info is None
@@ -353,18 +306,12 @@ class TestCheckIfLiveAuthError:
         self, youtube_client: YouTubeClient
     ):
         """봇 감지 전에 라이브 발견되면 정상 반환 (예외 승격 안 함)."""
-        mock_info = LiveStreamInfo(
-            video_id="abc123",
-            url="https://www.youtube.com/watch?v=abc123",
-            title="Live",
-        )
+        bot_error = Exception("Sign in to confirm you're not a bot")
 
-        with patch.object(
-            youtube_client, "_check_streams_tab", return_value=mock_info
-        ):
+        with _patch_detection(youtube_client, _LIVE_INFO, bot_error, bot_error):
             is_live, stream_info = youtube_client.check_if_live(
                 "https://www.youtube.com/@TestChannel"
             )
 
         assert is_live is True
-        assert stream_info == mock_info
+        assert stream_info is _LIVE_INFO
@@ -15,11 +15,11 @@ diff로 어떤 필드가 바뀌었는지 확인한다.
 import json
 from pathlib import Path
 from typing import Any, Callable, Dict, Optional, Tuple
-from unittest.mock import MagicMock, patch
 
 import pytest
 
 from src.yt_monitor.youtube.client import YouTubeClient
+from tests.fakes import FakeYDL
 
 
 _FIXTURES_DIR: Path = Path(__file__).parent / "fixtures" / "youtube_responses"
@@ -47,15 +47,6 @@ def _build_fake_extract_info(channel_key: str) -> Callable[..., Any]:
     return fake_extract_info
 
 
-def _patch_yt_dlp_with_channel(channel_key: str):
-    """yt_dlp.YoutubeDL를 픽스처 기반 fake로 패치하는 context manager 생성."""
-    instance = MagicMock()
-    instance.__enter__ = MagicMock(return_value=instance)
-    instance.__exit__ = MagicMock(return_value=False)
-    instance.extract_info.side_effect = _build_fake_extract_info(channel_key)
-    return patch("yt_dlp.YoutubeDL", return_value=instance)
-
-
 class TestLiveDetectionGoldenFixtures:
     """실제 yt-dlp 응답으로 라이브 감지 컨트랙트를 못 박는다."""
 
@@ -64,7 +55,7 @@ class TestLiveDetectionGoldenFixtures:
         return YouTubeClient()
 
     def test_lofigirl_detected_as_live_via_live_endpoint(
-        self, youtube_client: YouTubeClient
+        self, youtube_client: YouTubeClient, mock_ydl: FakeYDL
     ):
         """캡처 시점의 LofiGirl 라이브 응답에서 video_id를 추출해야 한다.
 
@@ -76,21 +67,25 @@ class TestLiveDetectionGoldenFixtures:
         assert live_endpoint_response is not None
         expected_video_id = live_endpoint_response["id"]
 
-        with _patch_yt_dlp_with_channel("lofigirl"):
-            is_live, stream_info = youtube_client.check_if_live(
-                "https://www.youtube.com/@LofiGirl"
-            )
+        mock_ydl.extract_info.side_effect = _build_fake_extract_info("lofigirl")
+
+        is_live, stream_info = youtube_client.check_if_live(
+            "https://www.youtube.com/@LofiGirl"
+        )
 
         assert is_live is True
         assert stream_info is not None
         assert stream_info.video_id == expected_video_id
 
-    def test_ted_not_detected_as_live(self, youtube_client: YouTubeClient):
+    def test_ted_not_detected_as_live(
+        self, youtube_client: YouTubeClient, mock_ydl: FakeYDL
+    ):
         """TED 채널은 라이브 안 하는 채널 — (False, None) 반환 보장."""
-        with _patch_yt_dlp_with_channel("ted"):
-            is_live, stream_info = youtube_client.check_if_live(
-                "https://www.youtube.com/@TED"
-            )
+        mock_ydl.extract_info.side_effect = _build_fake_extract_info("ted")
+
+        is_live, stream_info = youtube_client.check_if_live(
+            "https://www.youtube.com/@TED"
+        )
 
         assert is_live is False
         assert stream_info is None
@@ -2,60 +2,48 @@
 
 from unittest.mock import MagicMock, patch
 
-
 from src.yt_monitor.youtube.cookie_validation import (
     CookieValidationResult,
     CookieValidator,
 )
+from tests.fakes import FakeYDL
 
 
 class TestCookieValidatorResult:
     """validate()가 CookieValidationResult를 반환한다."""
 
-    def test_returns_valid_when_ytdlp_returns_title(self):
+    def test_returns_valid_when_ytdlp_returns_title(self, mock_ydl: FakeYDL):
         """yt-dlp 응답에 title이 있으면 valid=True."""
-        mock_ydl = MagicMock()
-        mock_ydl.__enter__ = lambda s: mock_ydl
-        mock_ydl.__exit__ = MagicMock(return_value=False)
         mock_ydl.extract_info.return_value = {
             "id": "jNQXAC9IVRw", "title": "Me at the zoo",
         }
 
         validator = CookieValidator(clock=lambda: 2000.0)
 
-        with patch("yt_dlp.YoutubeDL", return_value=mock_ydl):
-            result = validator.validate()
+        result = validator.validate()
 
         assert result.valid is True
         assert result.checked_at == 2000.0
         assert result.cached is False
 
-    def test_returns_invalid_when_title_missing(self):
+    def test_returns_invalid_when_title_missing(self, mock_ydl: FakeYDL):
         """yt-dlp가 title 없는 info를 반환하면 valid=False."""
-        mock_ydl = MagicMock()
-        mock_ydl.__enter__ = lambda s: mock_ydl
-        mock_ydl.__exit__ = MagicMock(return_value=False)
         mock_ydl.extract_info.return_value = {"id": "jNQXAC9IVRw"}
 
         validator = CookieValidator()
 
-        with patch("yt_dlp.YoutubeDL", return_value=mock_ydl):
-            result = validator.validate()
+        result = validator.validate()
 
         assert result.valid is False
         assert "만료" in result.message
 
-    def test_returns_invalid_on_ytdlp_exception(self):
+    def test_returns_invalid_on_ytdlp_exception(self, mock_ydl: FakeYDL):
         """yt-dlp 예외 시 valid=False + 적절한 메시지."""
-        mock_ydl = MagicMock()
-        mock_ydl.__enter__ = lambda s: mock_ydl
-        mock_ydl.__exit__ = MagicMock(return_value=False)
         mock_ydl.extract_info.side_effect = Exception("Sign in to confirm your age")
 
         validator = CookieValidator()
 
-        with patch("yt_dlp.YoutubeDL", return_value=mock_ydl):
-            result = validator.validate()
+        result = validator.validate()
 
         assert result.valid is False
         assert "만료" in result.message
@@ -64,11 +52,8 @@ class TestCookieValidatorResult:
 class TestCookieValidatorCache:
     """캐시 동작 검증."""
 
-    def test_cache_hit_returns_cached_flag(self):
+    def test_cache_hit_returns_cached_flag(self, mock_ydl: FakeYDL):
         """TTL 내 재호출은 cached=True, yt-dlp는 한 번만 호출."""
-        mock_ydl = MagicMock()
-        mock_ydl.__enter__ = lambda s: mock_ydl
-        mock_ydl.__exit__ = MagicMock(return_value=False)
         mock_ydl.extract_info.return_value = {"id": "x", "title": "test"}
 
         # 두 번의 clock 호출 — 100초 차이 (TTL 300초 내)
@@ -78,19 +63,15 @@ class TestCookieValidatorCache:
             clock=lambda: next(times),
         )
 
-        with patch("yt_dlp.YoutubeDL", return_value=mock_ydl):
-            first = validator.validate()
-            second = validator.validate()
+        first = validator.validate()
+        second = validator.validate()
 
         assert first.cached is False
         assert second.cached is True
         assert mock_ydl.extract_info.call_count == 1
 
-    def test_cache_expires_after_ttl(self):
+    def test_cache_expires_after_ttl(self, mock_ydl: FakeYDL):
         """TTL 경과 후 재호출은 다시 실제 검사."""
-        mock_ydl = MagicMock()
-        mock_ydl.__enter__ = lambda s: mock_ydl
-        mock_ydl.__exit__ = MagicMock(return_value=False)
         mock_ydl.extract_info.return_value = {"id": "x", "title": "test"}
 
         # 첫 호출 100초, 두 번째 500초 (TTL 300초 초과)
@@ -100,18 +81,14 @@ class TestCookieValidatorCache:
             clock=lambda: next(times),
         )
 
-        with patch("yt_dlp.YoutubeDL", return_value=mock_ydl):
-            validator.validate()
-            second = validator.validate()
+        validator.validate()
+        second = validator.validate()
 
         assert second.cached is False
         assert mock_ydl.extract_info.call_count == 2
 
-    def test_force_bypasses_cache(self):
+    def test_force_bypasses_cache(self, mock_ydl: FakeYDL):
         """force=True이면 캐시를 무시한다."""
-        mock_ydl = MagicMock()
-        mock_ydl.__enter__ = lambda s: mock_ydl
-        mock_ydl.__exit__ = MagicMock(return_value=False)
         mock_ydl.extract_info.return_value = {"id": "x", "title": "test"}
 
         times = iter([100.0, 150.0])
@@ -120,26 +97,21 @@ class TestCookieValidatorCache:
             clock=lambda: next(times),
         )
 
-        with patch("yt_dlp.YoutubeDL", return_value=mock_ydl):
-            validator.validate()
-            second = validator.validate(force=True)
+        validator.validate()
+        second = validator.validate(force=True)
 
         assert second.cached is False
         assert mock_ydl.extract_info.call_count == 2
 
-    def test_invalidate_cache_clears_state(self):
+    def test_invalidate_cache_clears_state(self, mock_ydl: FakeYDL):
         """invalidate_cache() 후에는 cached=False."""
-        mock_ydl = MagicMock()
-        mock_ydl.__enter__ = lambda s: mock_ydl
-        mock_ydl.__exit__ = MagicMock(return_value=False)
         mock_ydl.extract_info.return_value = {"id": "x", "title": "test"}
 
         validator = CookieValidator(clock=lambda: 1000.0)
 
-        with patch("yt_dlp.YoutubeDL", return_value=mock_ydl):
-            validator.validate()
-            validator.invalidate_cache()
-            result = validator.validate()
+        validator.validate()
+        validator.invalidate_cache()
+        result = validator.validate()
 
         assert result.cached is False
 
@@ -147,11 +119,8 @@ class TestCookieValidatorCache:
 class TestCookieValidatorNoNotifierCoupling:
     """validator는 알림 책임이 없다 — 네트워크/IO 외에 side-effect 없음."""
 
-    def test_validate_does_not_import_notifier(self):
+    def test_validate_does_not_import_notifier(self, mock_ydl: FakeYDL):
         """validate가 discord_notifier 모듈을 건드리지 않는지 확인 (mock 인스턴스 사용)."""
-        mock_ydl = MagicMock()
-        mock_ydl.__enter__ = lambda s: mock_ydl
-        mock_ydl.__exit__ = MagicMock(return_value=False)
         mock_ydl.extract_info.side_effect = Exception("network error")
 
         validator = CookieValidator(clock=lambda: 1000.0)
@@ -159,8 +128,7 @@ class TestCookieValidatorNoNotifierCoupling:
         # notifier 모듈을 mock으로 대체해도 validator가 접근 안 해야 통과
         mock_notifier_module = MagicMock()
         with patch("src.yt_monitor.notifications.discord.get_notifier", mock_notifier_module):
-            with patch("yt_dlp.YoutubeDL", return_value=mock_ydl):
-                result = validator.validate()
+            result = validator.validate()
 
         assert result.valid is False
         mock_notifier_module.assert_not_called()
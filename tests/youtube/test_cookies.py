@@ -72,3 +72,23 @@ class TestDockerBrowserCookies:
             "remote_components": ["ejs:github"],
             "js_runtimes": {"node": {}},
         }
+
+
+class TestYtDlpCacheDir:
+    def test_cache_dir_is_passed_as_cachedir(self, monkeypatch):
+        monkeypatch.setattr(cookie_options, "_YT_DLP_CACHE_DIR", "/app/cache/yt-dlp")
+
+        assert cookie_options.get_cache_options() == {"cachedir": "/app/cache/yt-dlp"}
+
+    def test_unset_cache_dir_returns_empty_options(self, monkeypatch):
+        monkeypatch.setattr(cookie_options, "_YT_DLP_CACHE_DIR", "")
+
+        assert cookie_options.get_cache_options() == {}
+
+    def test_cookie_options_do_not_include_cachedir(self, monkeypatch):
+        monkeypatch.setattr(cookie_options, "_is_docker", lambda: True)
+        monkeypatch.setattr(cookie_options, "_get_firefox_profile_path", lambda: "")
+        monkeypatch.setattr(cookie_options, "_POT_PROVIDER_URL", "")
+        monkeypatch.setattr(cookie_options, "_YT_DLP_CACHE_DIR", "/app/cache/yt-dlp")
+
+        assert "cachedir" not in cookie_options.get_cookie_options()